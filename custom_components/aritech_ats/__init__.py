@@ -32,7 +32,7 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
     if config_entry.version == 1:
         # Version 1 entries are x500 panels with PIN auth
-        new_data = {**config_entry.data}
+        new_data = dict(config_entry.data)
 
         # Add panel_type if not present (assume x500 for old entries)
         if CONF_PANEL_TYPE not in new_data:
@@ -60,6 +60,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to connect to Aritech panel: %s", err)
         raise ConfigEntryNotReady(f"Failed to connect: {err}") from err
 
+    # Starting the monitor publishes the initial data; refresh once here if it
+    # has not, so the platforms never have to wait for it themselves
+    if not coordinator.data:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await coordinator.async_disconnect()
+            raise
+
     # Store coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
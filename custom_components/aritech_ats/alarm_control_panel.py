@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.alarm_control_panel import (
@@ -11,37 +12,67 @@ from homeassistant.components.alarm_control_panel import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from aritech_client import AreaState
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import AritechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+SUPPORTED_FEATURES = (
+    AlarmControlPanelEntityFeature.ARM_HOME
+    | AlarmControlPanelEntityFeature.ARM_AWAY
+    | AlarmControlPanelEntityFeature.ARM_NIGHT
+)
+
+# AreaState flags exposed as extra state attributes, in display order
+AREA_ATTRIBUTES: tuple[str, ...] = (
+    "is_alarming",
+    "is_alarm_acknowledged",
+    "is_tampered",
+    "is_ready_to_arm",
+    "is_exiting",
+    "is_entering",
+    "has_fire",
+    "has_panic",
+    "has_medical",
+    "has_duress",
+    "has_technical",
+    "has_active_zones",
+    "has_inhibited_zones",
+    "has_isolated_zones",
+    "has_zone_faults",
+    "has_zone_tamper",
+    "is_buzzer_active",
+    "is_internal_siren",
+    "is_external_siren",
+    "is_strobe_active",
+)
+_get_area_attributes = attrgetter(*AREA_ATTRIBUTES)
+
+
+# AreaState flag -> alarm state, in priority order: alarm states first, then
+# armed states. An area with none of these flags set (i.e. unset) is disarmed.
+ALARM_STATE_PRIORITY: tuple[tuple[str, AlarmControlPanelState], ...] = (
+    ("is_alarming", AlarmControlPanelState.TRIGGERED),
+    ("is_entering", AlarmControlPanelState.PENDING),
+    ("is_exiting", AlarmControlPanelState.ARMING),
+    ("is_full_set", AlarmControlPanelState.ARMED_AWAY),
+    ("is_partially_set", AlarmControlPanelState.ARMED_HOME),
+    ("is_partially_set_2", AlarmControlPanelState.ARMED_NIGHT),
+)
+
 
 def _get_alarm_state(area_state: AreaState | None) -> AlarmControlPanelState:
     """Convert AreaState flags to Home Assistant alarm state."""
     if area_state is None:
         return AlarmControlPanelState.DISARMED
 
-    # Priority order: alarm states first, then armed states
-    if area_state.is_alarming:
-        return AlarmControlPanelState.TRIGGERED
-    if area_state.is_entering:
-        return AlarmControlPanelState.PENDING
-    if area_state.is_exiting:
-        return AlarmControlPanelState.ARMING
-    if area_state.is_full_set:
-        return AlarmControlPanelState.ARMED_AWAY
-    if area_state.is_partially_set:
-        return AlarmControlPanelState.ARMED_HOME
-    if area_state.is_partially_set_2:
-        return AlarmControlPanelState.ARMED_NIGHT
-    if area_state.is_unset:
-        return AlarmControlPanelState.DISARMED
+    for flag, alarm_state in ALARM_STATE_PRIORITY:
+        if getattr(area_state, flag):
+            return alarm_state
 
     return AlarmControlPanelState.DISARMED
 
@@ -54,19 +85,14 @@ async def async_setup_entry(
     """Set up Aritech alarm control panels from a config entry."""
     coordinator: AritechCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for coordinator to have data
-    if not coordinator.data:
-        _LOGGER.warning("Coordinator has no data yet, waiting for initialization")
-        await coordinator.async_config_entry_first_refresh()
-
     # Create an alarm panel entity for each area
     entities = []
-    for area in coordinator.get_areas():
+    for area_number, area_name in coordinator.get_areas():
         entities.append(
             AritechAlarmControlPanel(
                 coordinator=coordinator,
-                area_number=area["number"],
-                area_name=area["name"],
+                area_number=area_number,
+                area_name=area_name,
             )
         )
 
@@ -81,11 +107,7 @@ class AritechAlarmControlPanel(AlarmControlPanelEntity):
     """Representation of an Aritech area as an alarm control panel."""
 
     _attr_has_entity_name = True
-    _attr_supported_features = (
-        AlarmControlPanelEntityFeature.ARM_HOME
-        | AlarmControlPanelEntityFeature.ARM_AWAY
-        | AlarmControlPanelEntityFeature.ARM_NIGHT
-    )
+    _attr_supported_features = SUPPORTED_FEATURES
     _attr_code_arm_required = False
 
     def __init__(
@@ -99,33 +121,28 @@ class AritechAlarmControlPanel(AlarmControlPanelEntity):
         self._area_number = area_number
         self._area_name = area_name
         self._unregister_callback: callable | None = None
+        self._last_state: tuple | None = None
+        # Cached alarm_state / extra_state_attributes and the AreaState they were derived from
+        self._alarm_state_area_state: AreaState | None = None
+        self._alarm_state = AlarmControlPanelState.DISARMED
+        self._attrs_area_state: AreaState | None = None
+        self._attrs: dict[str, Any] = {"area_number": area_number}
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}"
+        self._attr_unique_id = coordinator.get_unique_id("area", area_number)
         self._attr_name = area_name
-        
+
         # Device info - each area is its own device under the panel
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_area_{area_number}")},
-            name=area_name,
-            manufacturer=MANUFACTURER,
-            model="Area",
-            via_device=(DOMAIN, coordinator.config_entry.entry_id),
-        )
+        self._attr_device_info = coordinator.get_device_info("area", area_number, area_name, "Area")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Register for area-specific callbacks
+        # Register for area-specific callbacks (also fired on (re)connect/disconnect)
         self._unregister_callback = self.coordinator.register_area_callback(
             self._area_number, self._handle_area_update
         )
-        
-        # Also listen to coordinator updates
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is being removed."""
@@ -136,7 +153,16 @@ class AritechAlarmControlPanel(AlarmControlPanelEntity):
 
     @callback
     def _handle_area_update(self) -> None:
-        """Handle area state update."""
+        """Handle area state update, skipping the write if the area did not change."""
+        # AreaState is a dataclass that the client re-creates on every change, so
+        # comparing it by value covers the alarm state and all extra attributes.
+        state = (
+            self.available,
+            self.coordinator.get_area_state_obj(self._area_number),
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -146,77 +172,54 @@ class AritechAlarmControlPanel(AlarmControlPanelEntity):
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
-        """Return the state of the alarm."""
+        """Return the state of the alarm, re-derived only when the AreaState changes."""
         area_state = self.coordinator.get_area_state_obj(self._area_number)
-        return _get_alarm_state(area_state)
+        if area_state is not self._alarm_state_area_state:
+            self._alarm_state_area_state = area_state
+            self._alarm_state = _get_alarm_state(area_state)
+        return self._alarm_state
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the AreaState changes."""
         area_state = self.coordinator.get_area_state_obj(self._area_number)
+        if area_state is self._attrs_area_state:
+            return self._attrs
+
+        self._attrs_area_state = area_state
         if not area_state:
-            return {"area_number": self._area_number}
-
-        return {
-            "area_number": self._area_number,
-            "state_text": str(area_state),
-            "is_alarming": area_state.is_alarming,
-            "is_alarm_acknowledged": area_state.is_alarm_acknowledged,
-            "is_tampered": area_state.is_tampered,
-            "is_ready_to_arm": area_state.is_ready_to_arm,
-            "is_exiting": area_state.is_exiting,
-            "is_entering": area_state.is_entering,
-            "has_fire": area_state.has_fire,
-            "has_panic": area_state.has_panic,
-            "has_medical": area_state.has_medical,
-            "has_duress": area_state.has_duress,
-            "has_technical": area_state.has_technical,
-            "has_active_zones": area_state.has_active_zones,
-            "has_inhibited_zones": area_state.has_inhibited_zones,
-            "has_isolated_zones": area_state.has_isolated_zones,
-            "has_zone_faults": area_state.has_zone_faults,
-            "has_zone_tamper": area_state.has_zone_tamper,
-            "is_buzzer_active": area_state.is_buzzer_active,
-            "is_internal_siren": area_state.is_internal_siren,
-            "is_external_siren": area_state.is_external_siren,
-            "is_strobe_active": area_state.is_strobe_active,
-        }
+            self._attrs = {"area_number": self._area_number}
+        else:
+            self._attrs = {"area_number": self._area_number, "state_text": str(area_state)}
+            self._attrs.update(zip(AREA_ATTRIBUTES, _get_area_attributes(area_state)))
+        return self._attrs
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
         _LOGGER.info("Disarming area %d (%s)", self._area_number, self._area_name)
-        try:
-            await self.coordinator.async_disarm_area(self._area_number)
-        except Exception as err:
-            _LOGGER.error("Failed to disarm area %d: %s", self._area_number, err)
-            raise
+        await self.coordinator.async_disarm_area(self._area_number)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away (full) command."""
-        force = self.coordinator.get_force_arm(self._area_number)
-        _LOGGER.info("Arming area %d (%s) - full%s", self._area_number, self._area_name, " (force)" if force else "")
-        try:
-            await self.coordinator.async_arm_area(self._area_number, "full", force=force)
-        except Exception as err:
-            _LOGGER.error("Failed to arm area %d: %s", self._area_number, err)
-            raise
+        await self._async_arm("full")
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home (part 1) command."""
-        force = self.coordinator.get_force_arm(self._area_number)
-        _LOGGER.info("Arming area %d (%s) - part1%s", self._area_number, self._area_name, " (force)" if force else "")
-        try:
-            await self.coordinator.async_arm_area(self._area_number, "part1", force=force)
-        except Exception as err:
-            _LOGGER.error("Failed to arm area %d (part1): %s", self._area_number, err)
-            raise
+        await self._async_arm("part1")
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         """Send arm night (part 2) command."""
+        await self._async_arm("part2")
+
+    async def _async_arm(self, mode: str) -> None:
+        """Arm the area in the given mode, honouring the force arm switch."""
         force = self.coordinator.get_force_arm(self._area_number)
-        _LOGGER.info("Arming area %d (%s) - part2%s", self._area_number, self._area_name, " (force)" if force else "")
-        try:
-            await self.coordinator.async_arm_area(self._area_number, "part2", force=force)
-        except Exception as err:
-            _LOGGER.error("Failed to arm area %d (part2): %s", self._area_number, err)
-            raise
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Arming area %d (%s) - %s%s",
+                self._area_number,
+                self._area_name,
+                mode,
+                " (force)" if force else "",
+            )
+        await self.coordinator.async_arm_area(self._area_number, mode, force=force)
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -11,55 +13,57 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from aritech_client import AreaState, ZoneState, DoorState
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import AritechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map zone name patterns to device classes
-ZONE_NAME_DEVICE_CLASS_PATTERNS: list[tuple[str, BinarySensorDeviceClass]] = [
-    (r"(?i)(pir|motion|beweging|detector)", BinarySensorDeviceClass.MOTION),
-    (r"(?i)(door|deur|entrance|entry|ingang)", BinarySensorDeviceClass.DOOR),
-    (r"(?i)(window|raam|venster)", BinarySensorDeviceClass.WINDOW),
-    (r"(?i)(smoke|rook|brand)", BinarySensorDeviceClass.SMOKE),
-    (r"(?i)(glass|glas|break)", BinarySensorDeviceClass.VIBRATION),
-    (r"(?i)(garage|poort|gate)", BinarySensorDeviceClass.GARAGE_DOOR),
-    (r"(?i)(tamper|sabotage)", BinarySensorDeviceClass.TAMPER),
-    (r"(?i)(panic|paniek|overval)", BinarySensorDeviceClass.SAFETY),
-    (r"(?i)(water|leak|lek)", BinarySensorDeviceClass.MOISTURE),
-    (r"(?i)(heat|warmte|temp)", BinarySensorDeviceClass.HEAT),
-    (r"(?i)(gas)", BinarySensorDeviceClass.GAS),
-    (r"(?i)(co2|carbon)", BinarySensorDeviceClass.CO),
+# Map zone name keywords to device classes, in priority order
+ZONE_NAME_DEVICE_CLASS_PATTERNS: list[tuple[str, str, BinarySensorDeviceClass]] = [
+    ("motion", r"pir|motion|beweging|detector", BinarySensorDeviceClass.MOTION),
+    ("door", r"door|deur|entrance|entry|ingang", BinarySensorDeviceClass.DOOR),
+    ("window", r"window|raam|venster", BinarySensorDeviceClass.WINDOW),
+    ("smoke", r"smoke|rook|brand", BinarySensorDeviceClass.SMOKE),
+    ("glass", r"glass|glas|break", BinarySensorDeviceClass.VIBRATION),
+    ("garage", r"garage|poort|gate", BinarySensorDeviceClass.GARAGE_DOOR),
+    ("tamper", r"tamper|sabotage", BinarySensorDeviceClass.TAMPER),
+    ("panic", r"panic|paniek|overval", BinarySensorDeviceClass.SAFETY),
+    ("water", r"water|leak|lek", BinarySensorDeviceClass.MOISTURE),
+    ("heat", r"heat|warmte|temp", BinarySensorDeviceClass.HEAT),
+    ("gas", r"gas", BinarySensorDeviceClass.GAS),
+    ("co", r"co2|carbon", BinarySensorDeviceClass.CO),
 ]
+_ZONE_NAME_TAG_TO_CLASS: dict[str, BinarySensorDeviceClass] = {
+    tag: device_class for tag, _, device_class in ZONE_NAME_DEVICE_CLASS_PATTERNS
+}
+
+
+# All patterns fused into one regex. Each alternative is a lookahead anchored at
+# the start of the name, so the first pattern in the table that matches anywhere
+# wins (e.g. "Garage Door" is still a door), exactly like a sequential search.
+_ZONE_NAME_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?=.*?(?P<{tag}>{body}))" for tag, body, _ in ZONE_NAME_DEVICE_CLASS_PATTERNS
+    )
+    + ")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
+@lru_cache(maxsize=512)
 def guess_device_class(zone_name: str) -> BinarySensorDeviceClass | None:
     """Guess the device class based on zone name."""
-    for pattern, device_class in ZONE_NAME_DEVICE_CLASS_PATTERNS:
-        if re.search(pattern, zone_name):
-            return device_class
+    if match := _ZONE_NAME_RE.search(zone_name):
+        return _ZONE_NAME_TAG_TO_CLASS[match.lastgroup]
     # Default to motion for generic zones
     return BinarySensorDeviceClass.MOTION
 
 
-def _get_zone_device_info(
-    coordinator: AritechCoordinator, zone_number: int, zone_name: str
-) -> DeviceInfo:
-    """Get device info for a zone (each zone is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_zone_{zone_number}")},
-        name=zone_name,
-        manufacturer=MANUFACTURER,
-        model="Zone",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -68,150 +72,36 @@ async def async_setup_entry(
     """Set up Aritech binary sensors from a config entry."""
     coordinator: AritechCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for coordinator to have data
-    if not coordinator.data:
-        _LOGGER.warning("Coordinator has no data yet, waiting for initialization")
-        await coordinator.async_config_entry_first_refresh()
-
-    entities: list[BinarySensorEntity] = []
-
-    # Create multiple binary sensors per zone (each zone is its own device)
-    for zone in coordinator.get_zones():
-        zone_num = zone["number"]
-        zone_name = zone["name"]
-
-        # Main zone sensor (active state - motion/door/etc)
-        entities.append(
-            AritechZoneActiveBinarySensor(
+    # Each zone, area and door is its own device; its sensors are listed together
+    entities: list[BinarySensorEntity] = [
+        *(
+            sensor_cls(
                 coordinator=coordinator,
-                zone_number=zone_num,
+                zone_number=zone_number,
                 zone_name=zone_name,
             )
-        )
-
-        # Zone tamper sensor
-        entities.append(
-            AritechZoneTamperBinarySensor(
-                coordinator=coordinator,
-                zone_number=zone_num,
-                zone_name=zone_name,
-            )
-        )
-
-        # Zone fault sensor
-        entities.append(
-            AritechZoneFaultBinarySensor(
-                coordinator=coordinator,
-                zone_number=zone_num,
-                zone_name=zone_name,
-            )
-        )
-
-        # Zone alarming sensor
-        entities.append(
-            AritechZoneAlarmingBinarySensor(
-                coordinator=coordinator,
-                zone_number=zone_num,
-                zone_name=zone_name,
-            )
-        )
-
-        # Zone isolated sensor
-        entities.append(
-            AritechZoneIsolatedBinarySensor(
-                coordinator=coordinator,
-                zone_number=zone_num,
-                zone_name=zone_name,
-            )
-        )
-
-    # Create area status binary sensors (alarm, tamper, fire, panic)
-    for area in coordinator.get_areas():
-        area_num = area["number"]
-        area_name = area["name"]
-
-        # Alarm sensor for each area
-        entities.append(
-            AritechAreaAlarmBinarySensor(
-                coordinator=coordinator,
-                area_number=area_num,
-                area_name=area_name,
-            )
-        )
-        # Tamper sensor for each area
-        entities.append(
-            AritechAreaTamperBinarySensor(
-                coordinator=coordinator,
-                area_number=area_num,
-                area_name=area_name,
-            )
-        )
-        # Fire sensor for each area
-        entities.append(
-            AritechAreaFireBinarySensor(
-                coordinator=coordinator,
-                area_number=area_num,
-                area_name=area_name,
-            )
-        )
-        # Panic sensor for each area
-        entities.append(
-            AritechAreaPanicBinarySensor(
+            for zone_number, zone_name in coordinator.get_zones()
+            for sensor_cls in ZONE_BINARY_SENSORS
+        ),
+        *(
+            sensor_cls(
                 coordinator=coordinator,
-                area_number=area_num,
+                area_number=area_number,
                 area_name=area_name,
             )
-        )
-
-    # Create door binary sensors
-    for door in coordinator.get_doors():
-        door_num = door["number"]
-        door_name = door["name"]
-
-        # Main door lock sensor
-        entities.append(
-            AritechDoorLockBinarySensor(
+            for area_number, area_name in coordinator.get_areas()
+            for sensor_cls in AREA_BINARY_SENSORS
+        ),
+        *(
+            sensor_cls(
                 coordinator=coordinator,
-                door_number=door_num,
+                door_number=door_number,
                 door_name=door_name,
             )
-        )
-
-        # Door open sensor
-        entities.append(
-            AritechDoorOpenBinarySensor(
-                coordinator=coordinator,
-                door_number=door_num,
-                door_name=door_name,
-            )
-        )
-
-        # Door forced sensor
-        entities.append(
-            AritechDoorForcedBinarySensor(
-                coordinator=coordinator,
-                door_number=door_num,
-                door_name=door_name,
-            )
-        )
-
-        # Door open too long sensor
-        entities.append(
-            AritechDoorOpenTooLongBinarySensor(
-                coordinator=coordinator,
-                door_number=door_num,
-                door_name=door_name,
-            )
-        )
-
-        # Door tamper sensor
-        entities.append(
-            AritechDoorTamperBinarySensor(
-                coordinator=coordinator,
-                door_number=door_num,
-                door_name=door_name,
-            )
-        )
+            for door_number, door_name in coordinator.get_doors()
+            for sensor_cls in DOOR_BINARY_SENSORS
+        ),
+    ]
 
     if entities:
         _LOGGER.info("Setting up %d binary sensors", len(entities))
@@ -225,10 +115,25 @@ async def async_setup_entry(
 # =============================================================================
 
 
-class AritechZoneActiveBinarySensor(BinarySensorEntity):
-    """Zone active/motion sensor - the primary sensor for zone detection."""
+class AritechZoneBinarySensorBase(BinarySensorEntity):
+    """Base class for zone binary sensors.
+
+    Subclasses set `_key` (unique_id suffix), `_attr_name` and `_state_attr`,
+    the ZoneState flag that drives `is_on`.
+    """
+
+    # Entity itself has no __slots__, so instances keep a __dict__; slotting our
+    # own per-entity fields still keeps them out of it.
+    __slots__ = (
+        "coordinator",
+        "_zone_number",
+        "_zone_name",
+        "_last_state",
+    )
 
     _attr_has_entity_name = True
+    _key: str
+    _state_attr: str
 
     def __init__(
         self,
@@ -236,44 +141,31 @@ class AritechZoneActiveBinarySensor(BinarySensorEntity):
         zone_number: int,
         zone_name: str,
     ) -> None:
-        """Initialize the zone active binary sensor."""
+        """Initialize the zone binary sensor."""
         self.coordinator = coordinator
         self._zone_number = zone_number
         self._zone_name = zone_name
-        self._unregister_callback: callable | None = None
-
-        # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_active"
-        self._attr_name = "Active"
-
-        # Guess device class from zone name
-        self._attr_device_class = guess_device_class(zone_name)
+        self._last_state: tuple | None = None
 
-        # Each zone is its own device
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
+        self._attr_unique_id = coordinator.get_unique_id("zone", zone_number) + "_" + self._key
+        self._attr_device_info = coordinator.get_device_info("zone", zone_number, zone_name, "Zone")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_zone_callback(
+                self._zone_number, self._handle_zone_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
+        """Handle zone state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -283,35 +175,30 @@ class AritechZoneActiveBinarySensor(BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        """Return true if the zone is active."""
+        """Return true if the zone flag for this sensor is set."""
         zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
         if not zone_state:
             return None
-        return zone_state.is_active
+        return getattr(zone_state, self._state_attr)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
-        if not zone_state:
-            return {"zone_number": self._zone_number}
 
-        return {
-            "zone_number": self._zone_number,
-            "state_text": str(zone_state),
-            "is_set": zone_state.is_set,
-            "is_anti_mask": zone_state.is_anti_mask,
-            "is_in_soak_test": zone_state.is_in_soak_test,
-            "has_battery_fault": zone_state.has_battery_fault,
-            "is_dirty": zone_state.is_dirty,
-        }
+# ZoneState flags exposed as extra attributes of the active sensor
+ZONE_ACTIVE_ATTRIBUTES: tuple[str, ...] = (
+    "is_set",
+    "is_anti_mask",
+    "is_in_soak_test",
+    "has_battery_fault",
+    "is_dirty",
+)
+_get_zone_active_attributes = attrgetter(*ZONE_ACTIVE_ATTRIBUTES)
 
 
-class AritechZoneTamperBinarySensor(BinarySensorEntity):
-    """Zone tamper sensor."""
+class AritechZoneActiveBinarySensor(AritechZoneBinarySensorBase):
+    """Zone active/motion sensor - the primary sensor for zone detection."""
 
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.TAMPER
+    _attr_name = "Active"
+    _key = "active"
+    _state_attr = "is_active"
 
     def __init__(
         self,
@@ -319,220 +206,67 @@ class AritechZoneTamperBinarySensor(BinarySensorEntity):
         zone_number: int,
         zone_name: str,
     ) -> None:
-        """Initialize the zone tamper binary sensor."""
-        self.coordinator = coordinator
-        self._zone_number = zone_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_tamper"
-        self._attr_name = "Tamper"
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
-        self.async_write_ha_state()
+        """Initialize the zone active binary sensor."""
+        super().__init__(coordinator, zone_number, zone_name)
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
+        # Guess device class from zone name
+        self._attr_device_class = guess_device_class(zone_name)
 
     @property
-    def is_on(self) -> bool | None:
-        """Return true if the zone is tampered."""
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes."""
         zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
         if not zone_state:
-            return None
-        return zone_state.is_tampered
-
-
-class AritechZoneFaultBinarySensor(BinarySensorEntity):
-    """Zone fault sensor."""
-
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+            return {"zone_number": self._zone_number}
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        zone_number: int,
-        zone_name: str,
-    ) -> None:
-        """Initialize the zone fault binary sensor."""
-        self.coordinator = coordinator
-        self._zone_number = zone_number
-        self._unregister_callback: callable | None = None
+        attrs = {"zone_number": self._zone_number, "state_text": str(zone_state)}
+        attrs.update(zip(ZONE_ACTIVE_ATTRIBUTES, _get_zone_active_attributes(zone_state)))
+        return attrs
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_fault"
-        self._attr_name = "Fault"
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
+class AritechZoneTamperBinarySensor(AritechZoneBinarySensorBase):
+    """Zone tamper sensor."""
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
+    _attr_device_class = BinarySensorDeviceClass.TAMPER
+    _attr_name = "Tamper"
+    _key = "tamper"
+    _state_attr = "is_tampered"
 
-    @callback
-    def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
-        self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
+class AritechZoneFaultBinarySensor(AritechZoneBinarySensorBase):
+    """Zone fault sensor."""
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the zone has a fault."""
-        zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
-        if not zone_state:
-            return None
-        return zone_state.has_fault
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_name = "Fault"
+    _key = "fault"
+    _state_attr = "has_fault"
 
 
-class AritechZoneAlarmingBinarySensor(BinarySensorEntity):
+class AritechZoneAlarmingBinarySensor(AritechZoneBinarySensorBase):
     """Zone alarming sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _attr_name = "Alarming"
+    _key = "alarming"
+    _state_attr = "is_alarming"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        zone_number: int,
-        zone_name: str,
-    ) -> None:
-        """Initialize the zone alarming binary sensor."""
-        self.coordinator = coordinator
-        self._zone_number = zone_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_alarming"
-        self._attr_name = "Alarming"
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the zone is alarming."""
-        zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
-        if not zone_state:
-            return None
-        return zone_state.is_alarming
-
-
-class AritechZoneIsolatedBinarySensor(BinarySensorEntity):
+class AritechZoneIsolatedBinarySensor(AritechZoneBinarySensorBase):
     """Zone isolated sensor."""
 
-    _attr_has_entity_name = True
     _attr_icon = "mdi:link-off"
+    _attr_name = "Isolated"
+    _key = "isolated"
+    _state_attr = "is_isolated"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        zone_number: int,
-        zone_name: str,
-    ) -> None:
-        """Initialize the zone isolated binary sensor."""
-        self.coordinator = coordinator
-        self._zone_number = zone_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_isolated"
-        self._attr_name = "Isolated"
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the zone is isolated."""
-        zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
-        if not zone_state:
-            return None
-        return zone_state.is_isolated
+ZONE_BINARY_SENSORS: tuple[type[AritechZoneBinarySensorBase], ...] = (
+    AritechZoneActiveBinarySensor,
+    AritechZoneTamperBinarySensor,
+    AritechZoneFaultBinarySensor,
+    AritechZoneAlarmingBinarySensor,
+    AritechZoneIsolatedBinarySensor,
+)
 
 
 # =============================================================================
@@ -540,24 +274,22 @@ class AritechZoneIsolatedBinarySensor(BinarySensorEntity):
 # =============================================================================
 
 
-def _get_area_device_info(
-    coordinator: AritechCoordinator, area_number: int, area_name: str
-) -> DeviceInfo:
-    """Get device info for an area."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_area_{area_number}")},
-        name=area_name,
-        manufacturer=MANUFACTURER,
-        model="Area",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
+class AritechAreaBinarySensorBase(BinarySensorEntity):
+    """Base class for area binary sensors.
 
+    Subclasses set `_key` (unique_id suffix), `_attr_name` and `_state_attr`,
+    the AreaState flag that drives `is_on`, unless they override `is_on`.
+    """
 
-class AritechAreaAlarmBinarySensor(BinarySensorEntity):
-    """Binary sensor for area alarm status."""
+    __slots__ = (
+        "coordinator",
+        "_area_number",
+        "_last_state",
+    )
 
     _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _key: str
+    _state_attr: str
 
     def __init__(
         self,
@@ -565,35 +297,30 @@ class AritechAreaAlarmBinarySensor(BinarySensorEntity):
         area_number: int,
         area_name: str,
     ) -> None:
-        """Initialize the area alarm binary sensor."""
+        """Initialize the area binary sensor."""
         self.coordinator = coordinator
         self._area_number = area_number
-        self._unregister_callback: callable | None = None
+        self._last_state: tuple | None = None
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_alarm"
-        self._attr_name = "Alarm"
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
+        self._attr_unique_id = coordinator.get_unique_id("area", area_number) + "_" + self._key
+        self._attr_device_info = coordinator.get_device_info("area", area_number, area_name, "Area")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_area_callback(
-            self._area_number, self._handle_area_update
-        )
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_area_callback(
+                self._area_number, self._handle_area_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_area_update(self) -> None:
-        """Handle area state update."""
+        """Handle area state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -603,183 +330,63 @@ class AritechAreaAlarmBinarySensor(BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        """Return true if the area is in alarm."""
+        """Return true if the area flag for this sensor is set."""
         area_state = self.coordinator.get_area_state_obj(self._area_number)
         if not area_state:
             return None
-        return area_state.is_alarming or area_state.is_alarm_acknowledged
-
-
-class AritechAreaTamperBinarySensor(BinarySensorEntity):
-    """Binary sensor for area tamper status."""
-
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.TAMPER
-
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        area_number: int,
-        area_name: str,
-    ) -> None:
-        """Initialize the area tamper binary sensor."""
-        self.coordinator = coordinator
-        self._area_number = area_number
-        self._unregister_callback: callable | None = None
+        return getattr(area_state, self._state_attr)
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_tamper"
-        self._attr_name = "Tamper"
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_area_callback(
-            self._area_number, self._handle_area_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_area_update(self) -> None:
-        """Handle area state update."""
-        self.async_write_ha_state()
+class AritechAreaAlarmBinarySensor(AritechAreaBinarySensorBase):
+    """Binary sensor for area alarm status."""
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _attr_name = "Alarm"
+    _key = "alarm"
 
     @property
     def is_on(self) -> bool | None:
-        """Return true if the area has tamper."""
+        """Return true if the area is in alarm."""
         area_state = self.coordinator.get_area_state_obj(self._area_number)
         if not area_state:
             return None
-        return area_state.is_tampered
-
-
-class AritechAreaFireBinarySensor(BinarySensorEntity):
-    """Binary sensor for area fire status."""
-
-    _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.SMOKE
-
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        area_number: int,
-        area_name: str,
-    ) -> None:
-        """Initialize the area fire binary sensor."""
-        self.coordinator = coordinator
-        self._area_number = area_number
-        self._unregister_callback: callable | None = None
+        return area_state.is_alarming or area_state.is_alarm_acknowledged
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_fire"
-        self._attr_name = "Fire"
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_area_callback(
-            self._area_number, self._handle_area_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
+class AritechAreaTamperBinarySensor(AritechAreaBinarySensorBase):
+    """Binary sensor for area tamper status."""
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
+    _attr_device_class = BinarySensorDeviceClass.TAMPER
+    _attr_name = "Tamper"
+    _key = "tamper"
+    _state_attr = "is_tampered"
 
-    @callback
-    def _handle_area_update(self) -> None:
-        """Handle area state update."""
-        self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
+class AritechAreaFireBinarySensor(AritechAreaBinarySensorBase):
+    """Binary sensor for area fire status."""
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the area has fire alarm."""
-        area_state = self.coordinator.get_area_state_obj(self._area_number)
-        if not area_state:
-            return None
-        return area_state.has_fire
+    _attr_device_class = BinarySensorDeviceClass.SMOKE
+    _attr_name = "Fire"
+    _key = "fire"
+    _state_attr = "has_fire"
 
 
-class AritechAreaPanicBinarySensor(BinarySensorEntity):
+class AritechAreaPanicBinarySensor(AritechAreaBinarySensorBase):
     """Binary sensor for area panic status."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.SAFETY
     _attr_icon = "mdi:alert"
+    _attr_name = "Panic"
+    _key = "panic"
+    _state_attr = "has_panic"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        area_number: int,
-        area_name: str,
-    ) -> None:
-        """Initialize the area panic binary sensor."""
-        self.coordinator = coordinator
-        self._area_number = area_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_panic"
-        self._attr_name = "Panic"
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_area_callback(
-            self._area_number, self._handle_area_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_area_update(self) -> None:
-        """Handle area state update."""
-        self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the area has panic alarm."""
-        area_state = self.coordinator.get_area_state_obj(self._area_number)
-        if not area_state:
-            return None
-        return area_state.has_panic
+AREA_BINARY_SENSORS: tuple[type[AritechAreaBinarySensorBase], ...] = (
+    AritechAreaAlarmBinarySensor,
+    AritechAreaTamperBinarySensor,
+    AritechAreaFireBinarySensor,
+    AritechAreaPanicBinarySensor,
+)
 
 
 # =============================================================================
@@ -787,24 +394,23 @@ class AritechAreaPanicBinarySensor(BinarySensorEntity):
 # =============================================================================
 
 
-def _get_door_device_info(
-    coordinator: AritechCoordinator, door_number: int, door_name: str
-) -> DeviceInfo:
-    """Get device info for a door (each door is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_door_{door_number}")},
-        name=door_name,
-        manufacturer=MANUFACTURER,
-        model="Door",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
+class AritechDoorBinarySensorBase(BinarySensorEntity):
+    """Base class for door binary sensors.
 
+    Subclasses set `_key` (unique_id suffix), `_attr_name` and `_state_attr`,
+    the DoorState flag that drives `is_on`, unless they override `is_on`.
+    """
 
-class AritechDoorLockBinarySensor(BinarySensorEntity):
-    """Door lock state sensor - shows if door is locked."""
+    __slots__ = (
+        "coordinator",
+        "_door_number",
+        "_door_name",
+        "_last_state",
+    )
 
     _attr_has_entity_name = True
-    _attr_device_class = BinarySensorDeviceClass.LOCK
+    _key: str
+    _state_attr: str
 
     def __init__(
         self,
@@ -812,36 +418,31 @@ class AritechDoorLockBinarySensor(BinarySensorEntity):
         door_number: int,
         door_name: str,
     ) -> None:
-        """Initialize the door lock binary sensor."""
+        """Initialize the door binary sensor."""
         self.coordinator = coordinator
         self._door_number = door_number
         self._door_name = door_name
-        self._unregister_callback: callable | None = None
+        self._last_state: tuple | None = None
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_lock"
-        self._attr_name = "Lock"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
+        self._attr_unique_id = coordinator.get_unique_id("door", door_number) + "_" + self._key
+        self._attr_device_info = coordinator.get_device_info("door", door_number, door_name, "Door")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_door_callback(
+                self._door_number, self._handle_door_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_door_update(self) -> None:
-        """Handle door state update."""
+        """Handle door state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -849,6 +450,33 @@ class AritechDoorLockBinarySensor(BinarySensorEntity):
         """Return if entity is available."""
         return self.coordinator.connected
 
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the door flag for this sensor is set."""
+        door_state = self.coordinator.get_door_state_obj(self._door_number)
+        if not door_state:
+            return None
+        return getattr(door_state, self._state_attr)
+
+
+# DoorState flags exposed as extra attributes of the lock sensor
+DOOR_LOCK_ATTRIBUTES: tuple[str, ...] = (
+    "is_unlocked",
+    "is_time_unlocked",
+    "is_standard_time_unlocked",
+    "is_unlocked_period",
+    "is_disabled",
+)
+_get_door_lock_attributes = attrgetter(*DOOR_LOCK_ATTRIBUTES)
+
+
+class AritechDoorLockBinarySensor(AritechDoorBinarySensorBase):
+    """Door lock state sensor - shows if door is locked."""
+
+    _attr_device_class = BinarySensorDeviceClass.LOCK
+    _attr_name = "Lock"
+    _key = "lock"
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the door is unlocked (lock binary sensor: on=unlocked)."""
@@ -865,241 +493,52 @@ class AritechDoorLockBinarySensor(BinarySensorEntity):
         if not door_state:
             return {"door_number": self._door_number}
 
-        return {
-            "door_number": self._door_number,
-            "state_text": str(door_state),
-            "is_unlocked": door_state.is_unlocked,
-            "is_time_unlocked": door_state.is_time_unlocked,
-            "is_standard_time_unlocked": door_state.is_standard_time_unlocked,
-            "is_unlocked_period": door_state.is_unlocked_period,
-            "is_disabled": door_state.is_disabled,
-        }
+        attrs = {"door_number": self._door_number, "state_text": str(door_state)}
+        attrs.update(zip(DOOR_LOCK_ATTRIBUTES, _get_door_lock_attributes(door_state)))
+        return attrs
 
 
-class AritechDoorOpenBinarySensor(BinarySensorEntity):
+class AritechDoorOpenBinarySensor(AritechDoorBinarySensorBase):
     """Door open/close sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.DOOR
+    _attr_name = "Open"
+    _key = "open"
+    _state_attr = "is_opened"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        door_number: int,
-        door_name: str,
-    ) -> None:
-        """Initialize the door open binary sensor."""
-        self.coordinator = coordinator
-        self._door_number = door_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_open"
-        self._attr_name = "Open"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_door_update(self) -> None:
-        """Handle door state update."""
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the door is open."""
-        door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return None
-        return door_state.is_opened
-
-
-class AritechDoorForcedBinarySensor(BinarySensorEntity):
+class AritechDoorForcedBinarySensor(AritechDoorBinarySensorBase):
     """Door forced open sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_name = "Forced"
+    _key = "forced"
+    _state_attr = "is_forced"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        door_number: int,
-        door_name: str,
-    ) -> None:
-        """Initialize the door forced binary sensor."""
-        self.coordinator = coordinator
-        self._door_number = door_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_forced"
-        self._attr_name = "Forced"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_door_update(self) -> None:
-        """Handle door state update."""
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the door was forced open."""
-        door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return None
-        return door_state.is_forced
-
-
-class AritechDoorOpenTooLongBinarySensor(BinarySensorEntity):
+class AritechDoorOpenTooLongBinarySensor(AritechDoorBinarySensorBase):
     """Door open too long sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_icon = "mdi:timer-alert"
+    _attr_name = "Open Too Long"
+    _key = "open_too_long"
+    _state_attr = "is_door_open_too_long"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        door_number: int,
-        door_name: str,
-    ) -> None:
-        """Initialize the door open too long binary sensor."""
-        self.coordinator = coordinator
-        self._door_number = door_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_open_too_long"
-        self._attr_name = "Open Too Long"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_door_update(self) -> None:
-        """Handle door state update."""
-        self.async_write_ha_state()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the door has been open too long."""
-        door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return None
-        return door_state.is_door_open_too_long
-
-
-class AritechDoorTamperBinarySensor(BinarySensorEntity):
+class AritechDoorTamperBinarySensor(AritechDoorBinarySensorBase):
     """Door reader tamper sensor."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.TAMPER
+    _attr_name = "Tamper"
+    _key = "tamper"
+    _state_attr = "is_reader_tamper"
 
-    def __init__(
-        self,
-        coordinator: AritechCoordinator,
-        door_number: int,
-        door_name: str,
-    ) -> None:
-        """Initialize the door tamper binary sensor."""
-        self.coordinator = coordinator
-        self._door_number = door_number
-        self._unregister_callback: callable | None = None
-
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_tamper"
-        self._attr_name = "Tamper"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass."""
-        await super().async_added_to_hass()
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
 
-    @callback
-    def _handle_door_update(self) -> None:
-        """Handle door state update."""
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.connected
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the door reader has been tampered."""
-        door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return None
-        return door_state.is_reader_tamper
+DOOR_BINARY_SENSORS: tuple[type[AritechDoorBinarySensorBase], ...] = (
+    AritechDoorLockBinarySensor,
+    AritechDoorOpenBinarySensor,
+    AritechDoorForcedBinarySensor,
+    AritechDoorOpenTooLongBinarySensor,
+    AritechDoorTamperBinarySensor,
+)
@@ -5,29 +5,15 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import AritechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_door_device_info(
-    coordinator: AritechCoordinator, door_number: int, door_name: str
-) -> DeviceInfo:
-    """Get device info for a door (each door is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_door_{door_number}")},
-        name=door_name,
-        manufacturer=MANUFACTURER,
-        model="Door",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -36,20 +22,15 @@ async def async_setup_entry(
     """Set up Aritech buttons from a config entry."""
     coordinator: AritechCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for coordinator to have data
-    if not coordinator.data:
-        _LOGGER.warning("Coordinator has no data yet, waiting for initialization")
-        await coordinator.async_config_entry_first_refresh()
-
     entities: list[ButtonEntity] = []
 
     # Create door unlock buttons
-    for door in coordinator.get_doors():
+    for door_number, door_name in coordinator.get_doors():
         entities.append(
             AritechDoorUnlockButton(
                 coordinator=coordinator,
-                door_number=door["number"],
-                door_name=door["name"],
+                door_number=door_number,
+                door_name=door_name,
             )
         )
 
@@ -78,9 +59,29 @@ class AritechDoorUnlockButton(ButtonEntity):
         self._door_name = door_name
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_unlock_standard"
+        self._attr_unique_id = coordinator.get_unique_id("door", door_number) + "_unlock_standard"
         self._attr_name = "Unlock (Standard Time)"
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
+        self._attr_device_info = coordinator.get_device_info("door", door_number, door_name, "Door")
+        self._last_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        # Door callbacks also fire on (re)connect/disconnect
+        self.async_on_remove(
+            self.coordinator.register_door_callback(
+                self._door_number, self._handle_door_update
+            )
+        )
+
+    @callback
+    def _handle_door_update(self) -> None:
+        """Handle door update; a button only needs a write when availability changes."""
+        available = self.available
+        if available == self._last_available:
+            return
+        self._last_available = available
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -90,8 +91,4 @@ class AritechDoorUnlockButton(ButtonEntity):
     async def async_press(self) -> None:
         """Unlock the door for standard time."""
         _LOGGER.info("Unlocking door %d (%s) for standard time", self._door_number, self._door_name)
-        try:
-            await self.coordinator.async_unlock_door_standard_time(self._door_number)
-        except Exception as err:
-            _LOGGER.error("Failed to unlock door %d: %s", self._door_number, err)
-            raise
+        await self.coordinator.async_unlock_door_standard_time(self._door_number)
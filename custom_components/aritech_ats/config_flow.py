@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -17,7 +18,7 @@ from homeassistant.helpers.selector import (
 )
 import homeassistant.helpers.config_validation as cv
 
-from aritech_client import AritechClient
+from aritech_client import AritechClient, AritechError, ErrorCode
 
 from .const import (
     DOMAIN,
@@ -33,33 +34,34 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# ASCII digits only; str.isdigit() would also accept other Unicode digits
+_DIGITS_RE = re.compile(r"[0-9]+")
+
+# Selectors shared by all schema fields
+TEXT_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+PASSWORD_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+
 # Step 1: Connection schema (host, port, encryption key)
 CONNECTION_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOST): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
+        vol.Required(CONF_HOST): TEXT_SELECTOR,
         vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
-        vol.Required(CONF_ENCRYPTION_KEY, default=DEFAULT_ENCRYPTION_KEY): TextSelector(
-            TextSelectorConfig(type=TextSelectorType.PASSWORD)
-        ),
+        vol.Required(CONF_ENCRYPTION_KEY, default=DEFAULT_ENCRYPTION_KEY): PASSWORD_SELECTOR,
     }
 )
 
 # Step 2a: x500 PIN authentication schema
 X500_AUTH_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_PIN_CODE, default=DEFAULT_PIN_CODE): TextSelector(
-            TextSelectorConfig(type=TextSelectorType.PASSWORD)
-        ),
+        vol.Required(CONF_PIN_CODE, default=DEFAULT_PIN_CODE): PASSWORD_SELECTOR,
     }
 )
 
 # Step 2b: x700 username/password authentication schema
 X700_AUTH_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_USERNAME): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
-        vol.Required(CONF_PASSWORD): TextSelector(
-            TextSelectorConfig(type=TextSelectorType.PASSWORD)
-        ),
+        vol.Required(CONF_USERNAME): TEXT_SELECTOR,
+        vol.Required(CONF_PASSWORD): PASSWORD_SELECTOR,
     }
 )
 
@@ -83,7 +85,7 @@ async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> dict
     encryption_key = data[CONF_ENCRYPTION_KEY]
 
     # Validate encryption key format
-    if not encryption_key.isdigit():
+    if not _DIGITS_RE.fullmatch(encryption_key):
         raise vol.Invalid("Encryption key must contain only digits")
     if len(encryption_key) != 24:
         raise vol.Invalid("Encryption key must be exactly 24 digits")
@@ -156,11 +158,14 @@ async def validate_full_connection(hass: HomeAssistant, data: dict[str, Any]) ->
             "panel_name": panel_name,
         }
 
-    except Exception as err:
+    except AritechError as err:
         _LOGGER.error("Failed to connect to Aritech panel: %s", err)
-        if "login" in str(err).lower() or "auth" in str(err).lower():
+        if err.code is ErrorCode.LOGIN_FAILED:
             raise InvalidAuth(f"Login failed: {err}") from err
         raise CannotConnect(f"Failed to connect: {err}") from err
+    except Exception as err:
+        _LOGGER.error("Failed to connect to Aritech panel: %s", err)
+        raise CannotConnect(f"Failed to connect: {err}") from err
     finally:
         await client.disconnect()
 
@@ -183,14 +188,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate connection and detect panel type
-                self._panel_info = await validate_connection(self.hass, user_input)
-                self._connection_data = user_input
-
                 # Check if already configured
                 await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
 
+                # Validate connection and detect panel type
+                self._panel_info = await validate_connection(self.hass, user_input)
+                self._connection_data = user_input
+
                 # Route to appropriate auth step based on panel type
                 if self._panel_info["is_x700"]:
                     return await self.async_step_x700_auth()
@@ -224,16 +229,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Validate PIN format
             pin_code = user_input.get(CONF_PIN_CODE, "")
-            if not pin_code.isdigit():
+            if not _DIGITS_RE.fullmatch(pin_code):
                 errors["base"] = "invalid_pin"
             else:
                 try:
                     # Combine connection data with auth data
-                    full_data = {
-                        **self._connection_data,
-                        **user_input,
-                        CONF_PANEL_TYPE: PANEL_TYPE_X500,
-                    }
+                    full_data = self._connection_data.copy()
+                    full_data.update(user_input)
+                    full_data[CONF_PANEL_TYPE] = PANEL_TYPE_X500
 
                     info = await validate_full_connection(self.hass, full_data)
                     return self.async_create_entry(title=info["title"], data=full_data)
@@ -268,11 +271,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 # Combine connection data with auth data
-                full_data = {
-                    **self._connection_data,
-                    **user_input,
-                    CONF_PANEL_TYPE: PANEL_TYPE_X700,
-                }
+                full_data = self._connection_data.copy()
+                full_data.update(user_input)
+                full_data[CONF_PANEL_TYPE] = PANEL_TYPE_X700
 
                 info = await validate_full_connection(self.hass, full_data)
                 return self.async_create_entry(title=info["title"], data=full_data)
@@ -24,3 +24,4 @@ MODEL_PREFIX = "ATS"
 
 # Update intervals
 UPDATE_INTERVAL = 30  # seconds
+DISCONNECT_TIMEOUT = 5.0  # seconds
@@ -3,29 +3,83 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import sys
 from dataclasses import dataclass, field
-from typing import Any
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Coroutine, ItemsView
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from aritech_client import AritechClient, AritechMonitor, ChangeEvent, InitializedEvent
 from aritech_client import AreaState, ZoneState, OutputState, TriggerState, DoorState
+from aritech_client.client import NamedItem
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
     CONF_ENCRYPTION_KEY,
     CONF_PIN_CODE,
     CONF_PANEL_TYPE,
     PANEL_TYPE_X700,
     UPDATE_INTERVAL,
+    DISCONNECT_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+_P = ParamSpec("_P")
+
+
+def _require_client(
+    action: str,
+) -> Callable[
+    [Callable[Concatenate[AritechCoordinator, AritechClient, int, _P], Awaitable[None]]],
+    Callable[Concatenate[AritechCoordinator, int, _P], Coroutine[Any, Any, None]],
+]:
+    """Wrap a control method so it runs against the connected client.
+
+    The wrapped method receives the client as its first argument and the
+    caller's signature drops it. Raises UpdateFailed when not connected and
+    logs the failed action (e.g. "arm area %d") before re-raising.
+    """
+
+    def decorator(
+        func: Callable[Concatenate[AritechCoordinator, AritechClient, int, _P], Awaitable[None]],
+    ) -> Callable[Concatenate[AritechCoordinator, int, _P], Coroutine[Any, Any, None]]:
+        @wraps(func)
+        async def wrapper(
+            self: AritechCoordinator, num: int, *args: _P.args, **kwargs: _P.kwargs
+        ) -> None:
+            if (client := self._client) is None:
+                raise UpdateFailed("Not connected to panel")
+            try:
+                await func(self, client, num, *args, **kwargs)
+            except Exception as err:
+                _LOGGER.error("Failed to %s: %s", action % num, err)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def _index_names(current: dict[int, str], items: list[NamedItem]) -> dict[int, str]:
+    """Map item numbers to names, reusing the current map if nothing changed."""
+    if len(current) == len(items) and all(
+        current.get(item.number) == item.name for item in items
+    ):
+        return current
+    return {item.number: item.name for item in items}
+
+
 @dataclass
 class AritechData:
     """Class to hold all Aritech panel data."""
@@ -36,19 +90,19 @@ class AritechData:
     firmware_version: str | None = None
     protocol_version: int | None = None
 
-    # Entity lists (name + number)
-    areas: list[dict[str, Any]] = field(default_factory=list)
-    zones: list[dict[str, Any]] = field(default_factory=list)
-    outputs: list[dict[str, Any]] = field(default_factory=list)
-    triggers: list[dict[str, Any]] = field(default_factory=list)
-    doors: list[dict[str, Any]] = field(default_factory=list)
+    # Entity names keyed by number
+    areas: dict[int, str] = field(default_factory=dict)
+    zones: dict[int, str] = field(default_factory=dict)
+    outputs: dict[int, str] = field(default_factory=dict)
+    triggers: dict[int, str] = field(default_factory=dict)
+    doors: dict[int, str] = field(default_factory=dict)
 
-    # Current states keyed by entity number
-    area_states: dict[int, dict[str, Any]] = field(default_factory=dict)
-    zone_states: dict[int, dict[str, Any]] = field(default_factory=dict)
-    output_states: dict[int, dict[str, Any]] = field(default_factory=dict)
-    trigger_states: dict[int, dict[str, Any]] = field(default_factory=dict)
-    door_states: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # Current state dataclasses keyed by entity number
+    area_states: dict[int, AreaState] = field(default_factory=dict)
+    zone_states: dict[int, ZoneState] = field(default_factory=dict)
+    output_states: dict[int, OutputState] = field(default_factory=dict)
+    trigger_states: dict[int, TriggerState] = field(default_factory=dict)
+    door_states: dict[int, DoorState] = field(default_factory=dict)
 
 
 class AritechCoordinator(DataUpdateCoordinator[AritechData]):
@@ -56,6 +110,11 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
 
     config_entry: ConfigEntry
 
+    # Reconnection backoff settings, shared by all instances
+    _RECONNECT_DELAYS: tuple[int, ...] = (5, 10, 20, 40, 60, 120)  # Exponential backoff delays in seconds
+    _LAST_DELAY_IDX: int = len(_RECONNECT_DELAYS) - 1
+    _MAX_RECONNECT_ATTEMPTS: int = 20  # Max attempts before longer pause
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -71,20 +130,65 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
         self._connected = False
         self._reconnect_task: asyncio.Task | None = None
 
-        # Reconnection backoff settings
+        # Reconnection backoff state
         self._reconnect_attempt: int = 0
-        self._reconnect_delays: list[int] = [5, 10, 20, 40, 60, 120]  # Exponential backoff delays in seconds
-        self._max_reconnect_attempts: int = 20  # Max attempts before longer pause
 
         # Callbacks for entity updates
-        self._area_callbacks: dict[int, list[callable]] = {}
-        self._zone_callbacks: dict[int, list[callable]] = {}
-        self._output_callbacks: dict[int, list[callable]] = {}
-        self._trigger_callbacks: dict[int, list[callable]] = {}
-        self._door_callbacks: dict[int, list[callable]] = {}
-
-        # Force arm state per area
-        self._force_arm: dict[int, bool] = {}
+        self._area_callbacks: defaultdict[int, list[CALLBACK_TYPE]] = defaultdict(list)
+        self._zone_callbacks: defaultdict[int, list[CALLBACK_TYPE]] = defaultdict(list)
+        self._output_callbacks: defaultdict[int, list[CALLBACK_TYPE]] = defaultdict(list)
+        self._trigger_callbacks: defaultdict[int, list[CALLBACK_TYPE]] = defaultdict(list)
+        self._door_callbacks: defaultdict[int, list[CALLBACK_TYPE]] = defaultdict(list)
+
+        # Areas with force arm enabled
+        self._force_arm: set[int] = set()
+
+        # Interned "<entry_id>_<kind>_<number>" strings, keyed by (kind, number)
+        self._unique_ids: dict[tuple[str, int], str] = {}
+
+        # DeviceInfo shared by all entities (across platforms) of one zone/area/output/door,
+        # keyed by (kind, number); the panel itself is ("panel", 0). Lives and dies
+        # with the config entry, so an unload/reload starts from scratch.
+        self._device_info_cache: dict[tuple[str, int], DeviceInfo] = {}
+
+    def get_unique_id(self, kind: str, number: int) -> str:
+        """Get the unique id of a zone, area, output, trigger or door.
+
+        This is also the identifier of the item's device, so the string is
+        built and interned once and shared by every entity referring to it.
+        """
+        key = (kind, number)
+        if (unique_id := self._unique_ids.get(key)) is None:
+            unique_id = self._unique_ids[key] = sys.intern(
+                f"{self.config_entry.entry_id}_{kind}_{number}"
+            )
+        return unique_id
+
+    def get_device_info(self, kind: str, number: int, name: str, model: str) -> DeviceInfo:
+        """Get device info for a zone, area, output or door (each is its own device)."""
+        key = (kind, number)
+        if (device_info := self._device_info_cache.get(key)) is None:
+            device_info = self._device_info_cache[key] = DeviceInfo(
+                identifiers={(DOMAIN, self.get_unique_id(kind, number))},
+                name=name,
+                manufacturer=MANUFACTURER,
+                model=model,
+                via_device=(DOMAIN, self.config_entry.entry_id),
+            )
+        return device_info
+
+    def get_panel_device_info(self) -> DeviceInfo:
+        """Get device info for the main panel."""
+        key = ("panel", 0)
+        if (device_info := self._device_info_cache.get(key)) is None:
+            device_info = self._device_info_cache[key] = DeviceInfo(
+                identifiers={(DOMAIN, self.config_entry.entry_id)},
+                name=self.panel_name or "Aritech Panel",
+                manufacturer=MANUFACTURER,
+                model=self.panel_model or "ATS Panel",
+                sw_version=self.firmware_version,
+            )
+        return device_info
 
     @property
     def client(self) -> AritechClient | None:
@@ -163,31 +267,67 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
             self._connected = True
             _LOGGER.info("Aritech monitoring started")
 
+            # A pending retry would tear down the connection we just made
+            self._cancel_reconnect()
+
+            # Every state was (re)loaded while still marked disconnected, so
+            # refresh all entities now that they are available
+            self._notify_all_callbacks()
+            self.async_update_listeners()
+
         except Exception as err:
-            self._connected = False
             _LOGGER.error("Failed to connect to Aritech panel: %s", err)
-            await self.async_disconnect()
+            await self._async_close()
             raise UpdateFailed(f"Failed to connect: {err}") from err
 
     async def async_disconnect(self) -> None:
-        """Disconnect from the alarm panel."""
+        """Disconnect from the alarm panel and stop reconnecting."""
+        self._cancel_reconnect()
+        self._reconnect_attempt = 0
+        await self._async_close()
+
+    async def _async_close(self) -> None:
+        """Close the monitor and client, leaving any reconnect chain running."""
         if self._monitor:
             self._monitor.stop()
             self._monitor = None
 
-        if self._client:
-            await self._client.disconnect()
-            self._client = None
+        # Drop the reference first so a cancelled teardown leaves no stale client
+        client, self._client = self._client, None
 
+        # Mark down and let entities refresh their availability before awaiting
+        # the socket, which may hang and have this teardown cancelled
+        was_connected = self._connected
         self._connected = False
+        if was_connected:
+            self._notify_all_callbacks()
+            self.async_update_listeners()
+
+        if client:
+            await client.disconnect()
         _LOGGER.debug("Disconnected from Aritech panel")
 
     def _setup_monitor_callbacks(self) -> None:
-        """Set up callbacks for monitor events."""
+        """Set up callbacks for monitor events.
+
+        The monitor and client invoke these inline on the event loop, so they
+        are plain @callback functions with no executor or task hop.
+        """
         if not self._monitor:
             return
 
+        # Bound once for the handlers below; _data and the callback registries
+        # are never replaced, only their contents
+        data = self._data
+        notify = self._notify_callbacks
+        zone_callbacks = self._zone_callbacks
+        area_callbacks = self._area_callbacks
+        output_callbacks = self._output_callbacks
+        trigger_callbacks = self._trigger_callbacks
+        door_callbacks = self._door_callbacks
+
         @self._monitor.on_initialized
+        @callback
         def handle_initialized(event: InitializedEvent) -> None:
             """Handle initialization event with all entity data."""
             _LOGGER.debug(
@@ -199,124 +339,144 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
                 len(event.doors),
             )
 
-            # Convert NamedItem lists to dicts for backward compatibility
-            self._data.zones = [{"number": z.number, "name": z.name} for z in event.zones]
-            self._data.areas = [{"number": a.number, "name": a.name} for a in event.areas]
-            self._data.outputs = [{"number": o.number, "name": o.name} for o in event.outputs]
-            self._data.triggers = [{"number": t.number, "name": t.name} for t in event.triggers]
-            self._data.doors = [{"number": d.number, "name": d.name} for d in event.doors]
-
-            # Store initial states (these contain state dataclass objects)
-            self._data.zone_states = event.zone_states
-            self._data.area_states = event.area_states
-            self._data.output_states = event.output_states
-            self._data.trigger_states = event.trigger_states
-            self._data.door_states = event.door_states
-
-            # Update coordinator data
-            self.async_set_updated_data(self._data)
+            # Index NamedItem lists by number. These are handed out as read-only
+            # views by get_areas() etc. and kept as-is across reconnects when
+            # the panel reports the same entities.
+            data.zones = _index_names(data.zones, event.zones)
+            data.areas = _index_names(data.areas, event.areas)
+            data.outputs = _index_names(data.outputs, event.outputs)
+            data.triggers = _index_names(data.triggers, event.triggers)
+            data.doors = _index_names(data.doors, event.doors)
+
+            # Unwrap the monitor's {"state": ..., "raw_hex": ...} dicts and keep
+            # only the state dataclasses
+            data.zone_states = {n: d["state"] for n, d in event.zone_states.items()}
+            data.area_states = {n: d["state"] for n, d in event.area_states.items()}
+            data.output_states = {n: d["state"] for n, d in event.output_states.items()}
+            data.trigger_states = {n: d["state"] for n, d in event.trigger_states.items()}
+            data.door_states = {n: d["state"] for n, d in event.door_states.items()}
+
+            # Update coordinator data; per-number entity callbacks are refreshed
+            # once the connection is marked up in async_connect
+            self.async_set_updated_data(data)
 
         @self._monitor.on_zone_changed
+        @callback
         def handle_zone_changed(event: ChangeEvent) -> None:
             """Handle zone state change."""
-            _LOGGER.debug(
-                "Zone %d (%s) changed: %s -> %s",
-                event.id,
-                event.name,
-                event.old_data.get("state") if event.old_data else "NEW",
-                event.new_data.get("state"),
-            )
-            
+            state = event.new_data["state"]
+            if data.zone_states.get(event.id) == state:
+                return  # Raw bytes changed but the decoded state did not
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Zone %d (%s) changed: %s -> %s",
+                    event.id,
+                    event.name,
+                    event.old_data.get("state") if event.old_data else "NEW",
+                    state,
+                )
+
             # Update stored state
-            self._data.zone_states[event.id] = event.new_data
-            
+            data.zone_states[event.id] = state
+
             # Notify specific zone callbacks
-            self._notify_callbacks(self._zone_callbacks, event.id)
-            
-            # Update coordinator
-            self.async_set_updated_data(self._data)
+            notify(zone_callbacks, event.id)
 
         @self._monitor.on_area_changed
+        @callback
         def handle_area_changed(event: ChangeEvent) -> None:
             """Handle area state change."""
-            _LOGGER.debug(
-                "Area %d (%s) changed: %s -> %s",
-                event.id,
-                event.name,
-                event.old_data.get("state") if event.old_data else "NEW",
-                event.new_data.get("state"),
-            )
-            
+            state = event.new_data["state"]
+            if data.area_states.get(event.id) == state:
+                return  # Raw bytes changed but the decoded state did not
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Area %d (%s) changed: %s -> %s",
+                    event.id,
+                    event.name,
+                    event.old_data.get("state") if event.old_data else "NEW",
+                    state,
+                )
+
             # Update stored state
-            self._data.area_states[event.id] = event.new_data
-            
+            data.area_states[event.id] = state
+
             # Notify specific area callbacks
-            self._notify_callbacks(self._area_callbacks, event.id)
-            
-            # Update coordinator
-            self.async_set_updated_data(self._data)
+            notify(area_callbacks, event.id)
 
         @self._monitor.on_output_changed
+        @callback
         def handle_output_changed(event: ChangeEvent) -> None:
             """Handle output state change."""
-            _LOGGER.debug(
-                "Output %d (%s) changed: %s -> %s",
-                event.id,
-                event.name,
-                event.old_data.get("state") if event.old_data else "NEW",
-                event.new_data.get("state"),
-            )
-            
+            state = event.new_data["state"]
+            if data.output_states.get(event.id) == state:
+                return  # Raw bytes changed but the decoded state did not
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Output %d (%s) changed: %s -> %s",
+                    event.id,
+                    event.name,
+                    event.old_data.get("state") if event.old_data else "NEW",
+                    state,
+                )
+
             # Update stored state
-            self._data.output_states[event.id] = event.new_data
-            
+            data.output_states[event.id] = state
+
             # Notify specific output callbacks
-            self._notify_callbacks(self._output_callbacks, event.id)
-            
-            # Update coordinator
-            self.async_set_updated_data(self._data)
+            notify(output_callbacks, event.id)
 
         @self._monitor.on_trigger_changed
+        @callback
         def handle_trigger_changed(event: ChangeEvent) -> None:
             """Handle trigger state change."""
-            _LOGGER.debug(
-                "Trigger %d (%s) changed: %s -> %s",
-                event.id,
-                event.name,
-                event.old_data.get("state") if event.old_data else "NEW",
-                event.new_data.get("state"),
-            )
+            state = event.new_data["state"]
+            if data.trigger_states.get(event.id) == state:
+                return  # Raw bytes changed but the decoded state did not
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Trigger %d (%s) changed: %s -> %s",
+                    event.id,
+                    event.name,
+                    event.old_data.get("state") if event.old_data else "NEW",
+                    state,
+                )
 
             # Update stored state
-            self._data.trigger_states[event.id] = event.new_data
+            data.trigger_states[event.id] = state
 
             # Notify specific trigger callbacks
-            self._notify_callbacks(self._trigger_callbacks, event.id)
-
-            # Update coordinator
-            self.async_set_updated_data(self._data)
+            notify(trigger_callbacks, event.id)
 
         @self._monitor.on_door_changed
+        @callback
         def handle_door_changed(event: ChangeEvent) -> None:
             """Handle door state change."""
-            _LOGGER.debug(
-                "Door %d (%s) changed: %s -> %s",
-                event.id,
-                event.name,
-                event.old_data.get("state") if event.old_data else "NEW",
-                event.new_data.get("state"),
-            )
+            state = event.new_data["state"]
+            if data.door_states.get(event.id) == state:
+                return  # Raw bytes changed but the decoded state did not
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Door %d (%s) changed: %s -> %s",
+                    event.id,
+                    event.name,
+                    event.old_data.get("state") if event.old_data else "NEW",
+                    state,
+                )
 
             # Update stored state
-            self._data.door_states[event.id] = event.new_data
+            data.door_states[event.id] = state
 
             # Notify specific door callbacks
-            self._notify_callbacks(self._door_callbacks, event.id)
-
-            # Update coordinator
-            self.async_set_updated_data(self._data)
+            notify(door_callbacks, event.id)
 
         @self._monitor.on_error
+        @callback
         def handle_error(error: Exception) -> None:
             """Handle monitor errors."""
             _LOGGER.error("Aritech monitor error: %s", error)
@@ -326,81 +486,97 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
         # Register client connection lost callback
         if self._client:
             @self._client.on_connection_lost
+            @callback
             def handle_connection_lost() -> None:
                 """Handle client connection lost (e.g., keep-alive failures)."""
                 _LOGGER.warning("Aritech client connection lost detected")
                 self._schedule_reconnect()
 
     @callback
-    def _notify_callbacks(self, callbacks: dict[int, list[callable]], entity_id: int) -> None:
-        """Notify callbacks for a specific entity."""
-        if entity_id in callbacks:
-            for callback_fn in callbacks[entity_id]:
-                try:
-                    callback_fn()
-                except Exception as err:
-                    _LOGGER.error("Error in entity callback: %s", err)
-
-    def register_area_callback(self, area_num: int, callback_fn: callable) -> callable:
-        """Register a callback for area state changes."""
-        if area_num not in self._area_callbacks:
-            self._area_callbacks[area_num] = []
-        self._area_callbacks[area_num].append(callback_fn)
-        
+    def _notify_callbacks(self, callbacks: dict[int, list[CALLBACK_TYPE]], entity_id: int) -> None:
+        """Notify callbacks for a specific entity.
+
+        Entity callbacks are plain @callback functions called inline in the event
+        loop, so there is no HassJob wrapping or job-type detection per update.
+        """
+        if not (callback_fns := callbacks.get(entity_id)):
+            return
+        log_error = _LOGGER.error
+        for callback_fn in callback_fns:
+            try:
+                callback_fn()
+            except Exception as err:
+                log_error("Error in entity callback: %s", err)
+
+    @callback
+    def _notify_all_callbacks(self) -> None:
+        """Notify every registered entity callback (e.g. after a full state reload)."""
+        for callbacks in (
+            self._area_callbacks,
+            self._zone_callbacks,
+            self._output_callbacks,
+            self._trigger_callbacks,
+            self._door_callbacks,
+        ):
+            # Snapshot the keys: a callback may unregister and drop its number
+            for entity_id in list(callbacks):
+                self._notify_callbacks(callbacks, entity_id)
+
+    @staticmethod
+    def _register_callback(
+        callbacks: defaultdict[int, list[CALLBACK_TYPE]], num: int, callback_fn: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Add a callback to a per-number registry and return its unregister function.
+
+        A number's list is dropped once its last callback unregisters, so
+        notifications never visit numbers without entities.
+        """
+        callbacks[num].append(callback_fn)
+
         def unregister() -> None:
-            self._area_callbacks[area_num].remove(callback_fn)
-        
+            if not (num_callbacks := callbacks.get(num)) or callback_fn not in num_callbacks:
+                return  # Already unregistered
+            num_callbacks.remove(callback_fn)
+            if not num_callbacks:
+                del callbacks[num]
+
         return unregister
 
-    def register_zone_callback(self, zone_num: int, callback_fn: callable) -> callable:
+    def register_area_callback(self, area_num: int, callback_fn: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Register a callback for area state changes."""
+        return self._register_callback(self._area_callbacks, area_num, callback_fn)
+
+    def register_zone_callback(self, zone_num: int, callback_fn: CALLBACK_TYPE) -> CALLBACK_TYPE:
         """Register a callback for zone state changes."""
-        if zone_num not in self._zone_callbacks:
-            self._zone_callbacks[zone_num] = []
-        self._zone_callbacks[zone_num].append(callback_fn)
-        
-        def unregister() -> None:
-            self._zone_callbacks[zone_num].remove(callback_fn)
-        
-        return unregister
+        return self._register_callback(self._zone_callbacks, zone_num, callback_fn)
 
-    def register_output_callback(self, output_num: int, callback_fn: callable) -> callable:
+    def register_output_callback(self, output_num: int, callback_fn: CALLBACK_TYPE) -> CALLBACK_TYPE:
         """Register a callback for output state changes."""
-        if output_num not in self._output_callbacks:
-            self._output_callbacks[output_num] = []
-        self._output_callbacks[output_num].append(callback_fn)
-        
-        def unregister() -> None:
-            self._output_callbacks[output_num].remove(callback_fn)
-        
-        return unregister
+        return self._register_callback(self._output_callbacks, output_num, callback_fn)
 
-    def register_trigger_callback(self, trigger_num: int, callback_fn: callable) -> callable:
+    def register_trigger_callback(self, trigger_num: int, callback_fn: CALLBACK_TYPE) -> CALLBACK_TYPE:
         """Register a callback for trigger state changes."""
-        if trigger_num not in self._trigger_callbacks:
-            self._trigger_callbacks[trigger_num] = []
-        self._trigger_callbacks[trigger_num].append(callback_fn)
+        return self._register_callback(self._trigger_callbacks, trigger_num, callback_fn)
 
-        def unregister() -> None:
-            self._trigger_callbacks[trigger_num].remove(callback_fn)
-
-        return unregister
-
-    def register_door_callback(self, door_num: int, callback_fn: callable) -> callable:
+    def register_door_callback(self, door_num: int, callback_fn: CALLBACK_TYPE) -> CALLBACK_TYPE:
         """Register a callback for door state changes."""
-        if door_num not in self._door_callbacks:
-            self._door_callbacks[door_num] = []
-        self._door_callbacks[door_num].append(callback_fn)
+        return self._register_callback(self._door_callbacks, door_num, callback_fn)
 
-        def unregister() -> None:
-            self._door_callbacks[door_num].remove(callback_fn)
+    def _get_reconnect_delay(self) -> float:
+        """Get the delay for the current reconnection attempt using exponential backoff.
 
-        return unregister
+        The delay is jittered between half and the full backoff step so that
+        several clients losing the panel at once do not retry in lockstep.
+        """
+        base = self._RECONNECT_DELAYS[min(self._reconnect_attempt, self._LAST_DELAY_IDX)]
+        return random.uniform(base / 2, base)
 
-    def _get_reconnect_delay(self) -> int:
-        """Get the delay for the current reconnection attempt using exponential backoff."""
-        if self._reconnect_attempt >= len(self._reconnect_delays):
-            return self._reconnect_delays[-1]  # Use max delay
-        return self._reconnect_delays[self._reconnect_attempt]
+    @callback
+    def _cancel_reconnect(self) -> None:
+        """Cancel a pending reconnect attempt, unless called from within it."""
+        task, self._reconnect_task = self._reconnect_task, None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
 
     def _schedule_reconnect(self) -> None:
         """Schedule a reconnection attempt with exponential backoff."""
@@ -413,14 +589,21 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
         async def reconnect() -> None:
             """Attempt to reconnect."""
             _LOGGER.info(
-                "Attempting to reconnect to Aritech panel in %d seconds (attempt %d)...",
+                "Attempting to reconnect to Aritech panel in %.1f seconds (attempt %d)...",
                 delay,
                 self._reconnect_attempt,
             )
             await asyncio.sleep(delay)
 
             try:
-                await self.async_disconnect()
+                if self._client is not None or self._monitor is not None:
+                    # Best-effort teardown: a hung socket must not delay recovery
+                    try:
+                        await asyncio.wait_for(
+                            self._async_close(), timeout=DISCONNECT_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        _LOGGER.debug("Timed out closing previous connection")
                 await self.async_connect()
                 _LOGGER.info(
                     "Reconnected to Aritech panel successfully after %d attempts",
@@ -434,12 +617,15 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
                     self._reconnect_attempt,
                     err,
                 )
-                if self._reconnect_attempt >= self._max_reconnect_attempts:
+                if self._reconnect_attempt >= self._MAX_RECONNECT_ATTEMPTS:
                     _LOGGER.warning(
                         "Max reconnection attempts (%d) reached. Will continue retrying with max delay (%ds).",
-                        self._max_reconnect_attempts,
-                        self._reconnect_delays[-1],
+                        self._MAX_RECONNECT_ATTEMPTS,
+                        self._RECONNECT_DELAYS[-1],
                     )
+                # This task is still running, so clear it or the guard would
+                # treat the retry as already scheduled
+                self._reconnect_task = None
                 self._schedule_reconnect()
 
         self._reconnect_task = self.hass.async_create_task(reconnect())
@@ -458,234 +644,146 @@ class AritechCoordinator(DataUpdateCoordinator[AritechData]):
 
     def set_force_arm(self, area_num: int, enabled: bool) -> None:
         """Set force arm state for an area."""
-        self._force_arm[area_num] = enabled
+        if enabled:
+            self._force_arm.add(area_num)
+        else:
+            self._force_arm.discard(area_num)
 
     def get_force_arm(self, area_num: int) -> bool:
         """Get force arm state for an area."""
-        return self._force_arm.get(area_num, False)
+        return area_num in self._force_arm
 
     # =========================================================================
     # CONTROL METHODS
     # =========================================================================
 
-    async def async_arm_area(self, area_num: int, mode: str = "full", force: bool = False) -> None:
+    @_require_client("arm area %d")
+    async def async_arm_area(
+        self, client: AritechClient, area_num: int, mode: str = "full", force: bool = False
+    ) -> None:
         """Arm an area."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.arm_area(area_num, set_type=mode, force=force)
-        except Exception as err:
-            _LOGGER.error("Failed to arm area %d: %s", area_num, err)
-            raise
+        await client.arm_area(area_num, set_type=mode, force=force)
 
-    async def async_disarm_area(self, area_num: int) -> None:
+    @_require_client("disarm area %d")
+    async def async_disarm_area(self, client: AritechClient, area_num: int) -> None:
         """Disarm an area."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.disarm_area(area_num)
 
-        try:
-            await self._client.disarm_area(area_num)
-        except Exception as err:
-            _LOGGER.error("Failed to disarm area %d: %s", area_num, err)
-            raise
-
-    async def async_inhibit_zone(self, zone_num: int) -> None:
+    @_require_client("inhibit zone %d")
+    async def async_inhibit_zone(self, client: AritechClient, zone_num: int) -> None:
         """Inhibit a zone."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.inhibit_zone(zone_num)
-        except Exception as err:
-            _LOGGER.error("Failed to inhibit zone %d: %s", zone_num, err)
-            raise
+        await client.inhibit_zone(zone_num)
 
-    async def async_uninhibit_zone(self, zone_num: int) -> None:
+    @_require_client("uninhibit zone %d")
+    async def async_uninhibit_zone(self, client: AritechClient, zone_num: int) -> None:
         """Uninhibit a zone."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.uninhibit_zone(zone_num)
-        except Exception as err:
-            _LOGGER.error("Failed to uninhibit zone %d: %s", zone_num, err)
-            raise
+        await client.uninhibit_zone(zone_num)
 
-    async def async_activate_output(self, output_num: int) -> None:
+    @_require_client("activate output %d")
+    async def async_activate_output(self, client: AritechClient, output_num: int) -> None:
         """Activate an output."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.activate_output(output_num)
 
-        try:
-            await self._client.activate_output(output_num)
-        except Exception as err:
-            _LOGGER.error("Failed to activate output %d: %s", output_num, err)
-            raise
-
-    async def async_deactivate_output(self, output_num: int) -> None:
+    @_require_client("deactivate output %d")
+    async def async_deactivate_output(self, client: AritechClient, output_num: int) -> None:
         """Deactivate an output."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.deactivate_output(output_num)
 
-        try:
-            await self._client.deactivate_output(output_num)
-        except Exception as err:
-            _LOGGER.error("Failed to deactivate output %d: %s", output_num, err)
-            raise
-
-    async def async_activate_trigger(self, trigger_num: int) -> None:
+    @_require_client("activate trigger %d")
+    async def async_activate_trigger(self, client: AritechClient, trigger_num: int) -> None:
         """Activate a trigger."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.activate_trigger(trigger_num)
 
-        try:
-            await self._client.activate_trigger(trigger_num)
-        except Exception as err:
-            _LOGGER.error("Failed to activate trigger %d: %s", trigger_num, err)
-            raise
-
-    async def async_deactivate_trigger(self, trigger_num: int) -> None:
+    @_require_client("deactivate trigger %d")
+    async def async_deactivate_trigger(self, client: AritechClient, trigger_num: int) -> None:
         """Deactivate a trigger."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.deactivate_trigger(trigger_num)
 
-        try:
-            await self._client.deactivate_trigger(trigger_num)
-        except Exception as err:
-            _LOGGER.error("Failed to deactivate trigger %d: %s", trigger_num, err)
-            raise
-
-    async def async_lock_door(self, door_num: int) -> None:
+    @_require_client("lock door %d")
+    async def async_lock_door(self, client: AritechClient, door_num: int) -> None:
         """Lock a door."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.lock_door(door_num)
-        except Exception as err:
-            _LOGGER.error("Failed to lock door %d: %s", door_num, err)
-            raise
+        await client.lock_door(door_num)
 
-    async def async_unlock_door(self, door_num: int) -> None:
+    @_require_client("unlock door %d")
+    async def async_unlock_door(self, client: AritechClient, door_num: int) -> None:
         """Unlock a door."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.unlock_door(door_num)
-        except Exception as err:
-            _LOGGER.error("Failed to unlock door %d: %s", door_num, err)
-            raise
+        await client.unlock_door(door_num)
 
-    async def async_unlock_door_standard_time(self, door_num: int) -> None:
+    @_require_client("unlock door %d (standard time)")
+    async def async_unlock_door_standard_time(self, client: AritechClient, door_num: int) -> None:
         """Unlock a door for the standard configured time."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.unlock_door_standard_time(door_num)
-        except Exception as err:
-            _LOGGER.error("Failed to unlock door %d (standard time): %s", door_num, err)
-            raise
+        await client.unlock_door_standard_time(door_num)
 
-    async def async_enable_door(self, door_num: int) -> None:
+    @_require_client("enable door %d")
+    async def async_enable_door(self, client: AritechClient, door_num: int) -> None:
         """Enable a door."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
+        await client.enable_door(door_num)
 
-        try:
-            await self._client.enable_door(door_num)
-        except Exception as err:
-            _LOGGER.error("Failed to enable door %d: %s", door_num, err)
-            raise
-
-    async def async_disable_door(self, door_num: int) -> None:
+    @_require_client("disable door %d")
+    async def async_disable_door(self, client: AritechClient, door_num: int) -> None:
         """Disable a door."""
-        if not self._client:
-            raise UpdateFailed("Not connected to panel")
-
-        try:
-            await self._client.disable_door(door_num)
-        except Exception as err:
-            _LOGGER.error("Failed to disable door %d: %s", door_num, err)
-            raise
+        await client.disable_door(door_num)
 
     # =========================================================================
     # DATA ACCESS
     # =========================================================================
 
-    def get_area_state(self, area_num: int) -> dict[str, Any] | None:
-        """Get current state dict of an area (contains 'state' key with AreaState dataclass)."""
-        return self._data.area_states.get(area_num)
-
     def get_area_state_obj(self, area_num: int) -> AreaState | None:
         """Get the AreaState dataclass for an area."""
-        state_data = self._data.area_states.get(area_num)
-        if state_data:
-            return state_data.get("state")
-        return None
-
-    def get_zone_state(self, zone_num: int) -> dict[str, Any] | None:
-        """Get current state dict of a zone (contains 'state' key with ZoneState dataclass)."""
-        return self._data.zone_states.get(zone_num)
+        return self._data.area_states.get(area_num)
 
     def get_zone_state_obj(self, zone_num: int) -> ZoneState | None:
         """Get the ZoneState dataclass for a zone."""
-        state_data = self._data.zone_states.get(zone_num)
-        if state_data:
-            return state_data.get("state")
-        return None
-
-    def get_output_state(self, output_num: int) -> dict[str, Any] | None:
-        """Get current state dict of an output (contains 'state' key with OutputState dataclass)."""
-        return self._data.output_states.get(output_num)
+        return self._data.zone_states.get(zone_num)
 
     def get_output_state_obj(self, output_num: int) -> OutputState | None:
         """Get the OutputState dataclass for an output."""
-        state_data = self._data.output_states.get(output_num)
-        if state_data:
-            return state_data.get("state")
-        return None
-
-    def get_trigger_state(self, trigger_num: int) -> dict[str, Any] | None:
-        """Get current state dict of a trigger (contains 'state' key with TriggerState dataclass)."""
-        return self._data.trigger_states.get(trigger_num)
+        return self._data.output_states.get(output_num)
 
     def get_trigger_state_obj(self, trigger_num: int) -> TriggerState | None:
         """Get the TriggerState dataclass for a trigger."""
-        state_data = self._data.trigger_states.get(trigger_num)
-        if state_data:
-            return state_data.get("state")
-        return None
+        return self._data.trigger_states.get(trigger_num)
 
-    def get_areas(self) -> list[dict[str, Any]]:
-        """Get list of all areas."""
-        return self._data.areas
+    def get_areas(self) -> ItemsView[int, str]:
+        """Get (number, name) pairs of all areas (a read-only view of the shared data)."""
+        return self._data.areas.items()
 
-    def get_zones(self) -> list[dict[str, Any]]:
-        """Get list of all zones."""
-        return self._data.zones
+    def get_area_name(self, area_num: int) -> str | None:
+        """Get the name of an area by number."""
+        return self._data.areas.get(area_num)
 
-    def get_outputs(self) -> list[dict[str, Any]]:
-        """Get list of all outputs."""
-        return self._data.outputs
+    def get_zones(self) -> ItemsView[int, str]:
+        """Get (number, name) pairs of all zones (a read-only view of the shared data)."""
+        return self._data.zones.items()
 
-    def get_triggers(self) -> list[dict[str, Any]]:
-        """Get list of all triggers."""
-        return self._data.triggers
+    def get_zone_name(self, zone_num: int) -> str | None:
+        """Get the name of a zone by number."""
+        return self._data.zones.get(zone_num)
 
-    def get_door_state(self, door_num: int) -> dict[str, Any] | None:
-        """Get current state dict of a door (contains 'state' key with DoorState dataclass)."""
-        return self._data.door_states.get(door_num)
+    def get_outputs(self) -> ItemsView[int, str]:
+        """Get (number, name) pairs of all outputs (a read-only view of the shared data)."""
+        return self._data.outputs.items()
+
+    def get_output_name(self, output_num: int) -> str | None:
+        """Get the name of an output by number."""
+        return self._data.outputs.get(output_num)
+
+    def get_triggers(self) -> ItemsView[int, str]:
+        """Get (number, name) pairs of all triggers (a read-only view of the shared data)."""
+        return self._data.triggers.items()
+
+    def get_trigger_name(self, trigger_num: int) -> str | None:
+        """Get the name of a trigger by number."""
+        return self._data.triggers.get(trigger_num)
 
     def get_door_state_obj(self, door_num: int) -> DoorState | None:
         """Get the DoorState dataclass for a door."""
-        state_data = self._data.door_states.get(door_num)
-        if state_data:
-            return state_data.get("state")
-        return None
-
-    def get_doors(self) -> list[dict[str, Any]]:
-        """Get list of all doors."""
-        return self._data.doors
+        return self._data.door_states.get(door_num)
+
+    def get_doors(self) -> ItemsView[int, str]:
+        """Get (number, name) pairs of all doors (a read-only view of the shared data)."""
+        return self._data.doors.items()
+
+    def get_door_name(self, door_num: int) -> str | None:
+        """Get the name of a door by number."""
+        return self._data.doors.get(door_num)
@@ -11,52 +11,14 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import AritechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_panel_device_info(coordinator: AritechCoordinator) -> DeviceInfo:
-    """Get device info for the main panel."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-        name=coordinator.panel_name or "Aritech Panel",
-        manufacturer=MANUFACTURER,
-        model=coordinator.panel_model or "ATS Panel",
-        sw_version=coordinator.firmware_version,
-    )
-
-
-def _get_area_device_info(
-    coordinator: AritechCoordinator, area_number: int, area_name: str
-) -> DeviceInfo:
-    """Get device info for an area."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_area_{area_number}")},
-        name=area_name,
-        manufacturer=MANUFACTURER,
-        model="Area",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
-def _get_zone_device_info(
-    coordinator: AritechCoordinator, zone_number: int, zone_name: str
-) -> DeviceInfo:
-    """Get device info for a zone (each zone is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_zone_{zone_number}")},
-        name=zone_name,
-        manufacturer=MANUFACTURER,
-        model="Zone",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -65,11 +27,6 @@ async def async_setup_entry(
     """Set up Aritech sensors from a config entry."""
     coordinator: AritechCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for coordinator to have data
-    if not coordinator.data:
-        _LOGGER.warning("Coordinator has no data yet, waiting for initialization")
-        await coordinator.async_config_entry_first_refresh()
-
     entities: list[SensorEntity] = []
 
     # Panel diagnostic sensors
@@ -78,22 +35,22 @@ async def async_setup_entry(
     entities.append(AritechConnectionStatusSensor(coordinator))
 
     # Area state sensors (textual state for automations)
-    for area in coordinator.get_areas():
+    for area_number, area_name in coordinator.get_areas():
         entities.append(
             AritechAreaStateSensor(
                 coordinator=coordinator,
-                area_number=area["number"],
-                area_name=area["name"],
+                area_number=area_number,
+                area_name=area_name,
             )
         )
 
     # Zone state sensors (textual state for automations) - part of zone device
-    for zone in coordinator.get_zones():
+    for zone_number, zone_name in coordinator.get_zones():
         entities.append(
             AritechZoneStateSensor(
                 coordinator=coordinator,
-                zone_number=zone["number"],
-                zone_name=zone["name"],
+                zone_number=zone_number,
+                zone_name=zone_name,
             )
         )
 
@@ -117,7 +74,7 @@ class AritechPanelModelSensor(SensorEntity):
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_panel_model"
         self._attr_name = "Panel Model"
-        self._attr_device_info = _get_panel_device_info(coordinator)
+        self._attr_device_info = coordinator.get_panel_device_info()
 
     @property
     def available(self) -> bool:
@@ -143,7 +100,7 @@ class AritechFirmwareVersionSensor(SensorEntity):
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_firmware_version"
         self._attr_name = "Firmware Version"
-        self._attr_device_info = _get_panel_device_info(coordinator)
+        self._attr_device_info = coordinator.get_panel_device_info()
 
     @property
     def available(self) -> bool:
@@ -171,7 +128,7 @@ class AritechConnectionStatusSensor(SensorEntity):
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_connection_status"
         self._attr_name = "Connection Status"
-        self._attr_device_info = _get_panel_device_info(coordinator)
+        self._attr_device_info = coordinator.get_panel_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -209,22 +166,19 @@ class AritechAreaStateSensor(SensorEntity):
         self._area_name = area_name
         self._unregister_callback: callable | None = None
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_state"
+        self._attr_unique_id = coordinator.get_unique_id("area", area_number) + "_state"
         self._attr_name = "State"
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
+        self._attr_device_info = coordinator.get_device_info("area", area_number, area_name, "Area")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
+        # Per-number callbacks also fire on (re)connect/disconnect
         self._unregister_callback = self.coordinator.register_area_callback(
             self._area_number, self._handle_area_update
         )
 
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is being removed."""
         if self._unregister_callback:
@@ -283,24 +237,21 @@ class AritechZoneStateSensor(SensorEntity):
         self._zone_name = zone_name
         self._unregister_callback: callable | None = None
 
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_state"
+        self._attr_unique_id = coordinator.get_unique_id("zone", zone_number) + "_state"
         self._attr_name = "State"
 
         # Zone state sensor belongs to the zone device
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
+        self._attr_device_info = coordinator.get_device_info("zone", zone_number, zone_name, "Zone")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
+        # Per-number callbacks also fire on (re)connect/disconnect
         self._unregister_callback = self.coordinator.register_zone_callback(
             self._zone_number, self._handle_zone_update
         )
 
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is being removed."""
         if self._unregister_callback:
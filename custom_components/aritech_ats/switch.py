@@ -7,77 +7,20 @@ from typing import Any
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, MANUFACTURER
+from aritech_client import DoorState, OutputState, TriggerState, ZoneState
+
+from .const import DOMAIN
 from .coordinator import AritechCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_zone_device_info(
-    coordinator: AritechCoordinator, zone_number: int, zone_name: str
-) -> DeviceInfo:
-    """Get device info for a zone (each zone is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_zone_{zone_number}")},
-        name=zone_name,
-        manufacturer=MANUFACTURER,
-        model="Zone",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
-def _get_output_device_info(
-    coordinator: AritechCoordinator, output_number: int, output_name: str
-) -> DeviceInfo:
-    """Get device info for an output (each output is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_output_{output_number}")},
-        name=output_name,
-        manufacturer=MANUFACTURER,
-        model="Output",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
-def _get_panel_device_info(coordinator: AritechCoordinator) -> DeviceInfo:
-    """Get device info for the main panel."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-        name=coordinator.panel_name or "Aritech Panel",
-        manufacturer=MANUFACTURER,
-        model=coordinator.panel_model or "ATS Panel",
-        sw_version=coordinator.firmware_version,
-    )
-
-
-def _get_area_device_info(
-    coordinator: AritechCoordinator, area_number: int, area_name: str
-) -> DeviceInfo:
-    """Get device info for an area (each area is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_area_{area_number}")},
-        name=area_name,
-        manufacturer=MANUFACTURER,
-        model="Area",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
-
-
-def _get_door_device_info(
-    coordinator: AritechCoordinator, door_number: int, door_name: str
-) -> DeviceInfo:
-    """Get device info for a door (each door is its own device)."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{coordinator.config_entry.entry_id}_door_{door_number}")},
-        name=door_name,
-        manufacturer=MANUFACTURER,
-        model="Door",
-        via_device=(DOMAIN, coordinator.config_entry.entry_id),
-    )
+def _door_lock_icon(is_unlocked: bool | None) -> str:
+    """Return the door lock switch icon for its lock state."""
+    return "mdi:door-open" if is_unlocked else "mdi:door-closed-lock"
 
 
 async def async_setup_entry(
@@ -88,71 +31,55 @@ async def async_setup_entry(
     """Set up Aritech switches from a config entry."""
     coordinator: AritechCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Wait for coordinator to have data
-    if not coordinator.data:
-        _LOGGER.warning("Coordinator has no data yet, waiting for initialization")
-        await coordinator.async_config_entry_first_refresh()
-
-    entities: list[SwitchEntity] = []
-
-    # Create zone inhibit switches (part of zone device)
-    for zone in coordinator.get_zones():
-        entities.append(
+    # Built in one pass; get_zones() etc. are views over the coordinator's maps
+    entities: list[SwitchEntity] = [
+        # Zone inhibit switches (part of zone device)
+        *(
             AritechZoneInhibitSwitch(
                 coordinator=coordinator,
-                zone_number=zone["number"],
-                zone_name=zone["name"],
+                zone_number=zone_number,
+                zone_name=zone_name,
             )
-        )
-
-    # Create output switches (part of panel device)
-    for output in coordinator.get_outputs():
-        entities.append(
+            for zone_number, zone_name in coordinator.get_zones()
+        ),
+        # Output switches (part of panel device)
+        *(
             AritechOutputSwitch(
                 coordinator=coordinator,
-                output_number=output["number"],
-                output_name=output["name"],
+                output_number=output_number,
+                output_name=output_name,
             )
-        )
-
-    # Create trigger switches (part of panel device)
-    for trigger in coordinator.get_triggers():
-        entities.append(
+            for output_number, output_name in coordinator.get_outputs()
+        ),
+        # Trigger switches (part of panel device)
+        *(
             AritechTriggerSwitch(
                 coordinator=coordinator,
-                trigger_number=trigger["number"],
-                trigger_name=trigger["name"],
+                trigger_number=trigger_number,
+                trigger_name=trigger_name,
             )
-        )
-
-    # Create force arm switches for each area
-    for area in coordinator.get_areas():
-        entities.append(
+            for trigger_number, trigger_name in coordinator.get_triggers()
+        ),
+        # Force arm switches for each area
+        *(
             AritechForceArmSwitch(
                 coordinator=coordinator,
-                area_number=area["number"],
-                area_name=area["name"],
+                area_number=area_number,
+                area_name=area_name,
             )
-        )
-
-    # Create door switches
-    for door in coordinator.get_doors():
-        # Door enable switch
-        entities.append(
-            AritechDoorEnableSwitch(
-                coordinator=coordinator,
-                door_number=door["number"],
-                door_name=door["name"],
-            )
-        )
-        # Door lock switch
-        entities.append(
-            AritechDoorLockSwitch(
+            for area_number, area_name in coordinator.get_areas()
+        ),
+        # Door enable and lock switches
+        *(
+            switch_cls(
                 coordinator=coordinator,
-                door_number=door["number"],
-                door_name=door["name"],
+                door_number=door_number,
+                door_name=door_name,
             )
-        )
+            for door_number, door_name in coordinator.get_doors()
+            for switch_cls in (AritechDoorEnableSwitch, AritechDoorLockSwitch)
+        ),
+    ]
 
     if entities:
         _LOGGER.info("Setting up %d switches", len(entities))
@@ -164,6 +91,15 @@ async def async_setup_entry(
 class AritechZoneInhibitSwitch(SwitchEntity):
     """Switch to inhibit/uninhibit a zone."""
 
+    __slots__ = (
+        "coordinator",
+        "_zone_number",
+        "_zone_name",
+        "_attrs_state",
+        "_attrs",
+        "_last_state",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:shield-off"
@@ -178,37 +114,35 @@ class AritechZoneInhibitSwitch(SwitchEntity):
         self.coordinator = coordinator
         self._zone_number = zone_number
         self._zone_name = zone_name
-        self._unregister_callback: callable | None = None
+        self._attrs_state: ZoneState | None = None
+        self._attrs: dict[str, Any] = {"zone_number": zone_number}
+        self._last_state: tuple | None = None
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_number}_inhibit"
+        self._attr_unique_id = coordinator.get_unique_id("zone", zone_number) + "_inhibit"
         self._attr_name = "Inhibit"
 
         # Zone inhibit switch belongs to the zone device
-        self._attr_device_info = _get_zone_device_info(coordinator, zone_number, zone_name)
+        self._attr_device_info = coordinator.get_device_info("zone", zone_number, zone_name, "Zone")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        self._unregister_callback = self.coordinator.register_zone_callback(
-            self._zone_number, self._handle_zone_update
-        )
-
+        # Per-number callbacks also fire on (re)connect/disconnect
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_zone_callback(
+                self._zone_number, self._handle_zone_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_zone_update(self) -> None:
-        """Handle zone state update."""
+        """Handle zone state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -226,38 +160,44 @@ class AritechZoneInhibitSwitch(SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the state object changes."""
         zone_state = self.coordinator.get_zone_state_obj(self._zone_number)
-        if not zone_state:
-            return {"zone_number": self._zone_number}
+        if zone_state is self._attrs_state:
+            return self._attrs
 
-        return {
-            "zone_number": self._zone_number,
-            "state_text": str(zone_state),
-        }
+        self._attrs_state = zone_state
+        if not zone_state:
+            self._attrs = {"zone_number": self._zone_number}
+        else:
+            self._attrs = {
+                "zone_number": self._zone_number,
+                "state_text": str(zone_state),
+            }
+        return self._attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Inhibit the zone."""
-        _LOGGER.info("Inhibiting zone %d (%s)", self._zone_number, self._zone_name)
-        try:
-            await self.coordinator.async_inhibit_zone(self._zone_number)
-        except Exception as err:
-            _LOGGER.error("Failed to inhibit zone %d: %s", self._zone_number, err)
-            raise
+        _LOGGER.debug("Inhibiting zone %d (%s)", self._zone_number, self._zone_name)
+        await self.coordinator.async_inhibit_zone(self._zone_number)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Uninhibit the zone."""
-        _LOGGER.info("Uninhibiting zone %d (%s)", self._zone_number, self._zone_name)
-        try:
-            await self.coordinator.async_uninhibit_zone(self._zone_number)
-        except Exception as err:
-            _LOGGER.error("Failed to uninhibit zone %d: %s", self._zone_number, err)
-            raise
+        _LOGGER.debug("Uninhibiting zone %d (%s)", self._zone_number, self._zone_name)
+        await self.coordinator.async_uninhibit_zone(self._zone_number)
 
 
 class AritechOutputSwitch(SwitchEntity):
     """Switch to control an output."""
 
+    __slots__ = (
+        "coordinator",
+        "_output_number",
+        "_output_name",
+        "_attrs_state",
+        "_attrs",
+        "_last_state",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.OUTLET
     _attr_icon = "mdi:electric-switch"
@@ -272,37 +212,35 @@ class AritechOutputSwitch(SwitchEntity):
         self.coordinator = coordinator
         self._output_number = output_number
         self._output_name = output_name
-        self._unregister_callback: callable | None = None
+        self._attrs_state: OutputState | None = None
+        self._attrs: dict[str, Any] = {"output_number": output_number}
+        self._last_state: tuple | None = None
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_output_{output_number}"
+        self._attr_unique_id = coordinator.get_unique_id("output", output_number)
         self._attr_name = "Switch"
 
         # Output switch belongs to its own output device
-        self._attr_device_info = _get_output_device_info(coordinator, output_number, output_name)
+        self._attr_device_info = coordinator.get_device_info("output", output_number, output_name, "Output")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        self._unregister_callback = self.coordinator.register_output_callback(
-            self._output_number, self._handle_output_update
-        )
-
+        # Per-number callbacks also fire on (re)connect/disconnect
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_output_callback(
+                self._output_number, self._handle_output_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_output_update(self) -> None:
-        """Handle output state update."""
+        """Handle output state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -320,39 +258,45 @@ class AritechOutputSwitch(SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the state object changes."""
         output_state = self.coordinator.get_output_state_obj(self._output_number)
-        if not output_state:
-            return {"output_number": self._output_number}
+        if output_state is self._attrs_state:
+            return self._attrs
 
-        return {
-            "output_number": self._output_number,
-            "state_text": str(output_state),
-            "is_forced": output_state.is_forced,
-        }
+        self._attrs_state = output_state
+        if not output_state:
+            self._attrs = {"output_number": self._output_number}
+        else:
+            self._attrs = {
+                "output_number": self._output_number,
+                "state_text": str(output_state),
+                "is_forced": output_state.is_forced,
+            }
+        return self._attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate the output."""
-        _LOGGER.info("Activating output %d (%s)", self._output_number, self._output_name)
-        try:
-            await self.coordinator.async_activate_output(self._output_number)
-        except Exception as err:
-            _LOGGER.error("Failed to activate output %d: %s", self._output_number, err)
-            raise
+        _LOGGER.debug("Activating output %d (%s)", self._output_number, self._output_name)
+        await self.coordinator.async_activate_output(self._output_number)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Deactivate the output."""
-        _LOGGER.info("Deactivating output %d (%s)", self._output_number, self._output_name)
-        try:
-            await self.coordinator.async_deactivate_output(self._output_number)
-        except Exception as err:
-            _LOGGER.error("Failed to deactivate output %d: %s", self._output_number, err)
-            raise
+        _LOGGER.debug("Deactivating output %d (%s)", self._output_number, self._output_name)
+        await self.coordinator.async_deactivate_output(self._output_number)
 
 
 class AritechTriggerSwitch(SwitchEntity):
     """Switch to control a trigger (manual activation only)."""
 
+    __slots__ = (
+        "coordinator",
+        "_trigger_number",
+        "_trigger_name",
+        "_attrs_state",
+        "_attrs",
+        "_last_state",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:gesture-tap-button"
@@ -367,37 +311,35 @@ class AritechTriggerSwitch(SwitchEntity):
         self.coordinator = coordinator
         self._trigger_number = trigger_number
         self._trigger_name = trigger_name
-        self._unregister_callback: callable | None = None
+        self._attrs_state: TriggerState | None = None
+        self._attrs: dict[str, Any] = {"trigger_number": trigger_number}
+        self._last_state: tuple | None = None
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_trigger_{trigger_number}"
+        self._attr_unique_id = coordinator.get_unique_id("trigger", trigger_number)
         self._attr_name = trigger_name
 
         # Trigger switches belong to the main panel device
-        self._attr_device_info = _get_panel_device_info(coordinator)
+        self._attr_device_info = coordinator.get_panel_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        self._unregister_callback = self.coordinator.register_trigger_callback(
-            self._trigger_number, self._handle_trigger_update
-        )
-
+        # Per-number callbacks also fire on (re)connect/disconnect
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_trigger_callback(
+                self._trigger_number, self._handle_trigger_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_trigger_update(self) -> None:
-        """Handle trigger state update."""
+        """Handle trigger state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -415,42 +357,41 @@ class AritechTriggerSwitch(SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the state object changes."""
         trigger_state = self.coordinator.get_trigger_state_obj(self._trigger_number)
-        if not trigger_state:
-            return {"trigger_number": self._trigger_number}
+        if trigger_state is self._attrs_state:
+            return self._attrs
 
-        return {
-            "trigger_number": self._trigger_number,
-            "state_text": str(trigger_state),
-            "is_remote_output": trigger_state.is_remote_output,
-            "is_fob": trigger_state.is_fob,
-            "is_schedule": trigger_state.is_schedule,
-            "is_function_key": trigger_state.is_function_key,
-        }
+        self._attrs_state = trigger_state
+        if not trigger_state:
+            self._attrs = {"trigger_number": self._trigger_number}
+        else:
+            self._attrs = {
+                "trigger_number": self._trigger_number,
+                "state_text": str(trigger_state),
+                "is_remote_output": trigger_state.is_remote_output,
+                "is_fob": trigger_state.is_fob,
+                "is_schedule": trigger_state.is_schedule,
+                "is_function_key": trigger_state.is_function_key,
+            }
+        return self._attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate the trigger."""
-        _LOGGER.info("Activating trigger %d (%s)", self._trigger_number, self._trigger_name)
-        try:
-            await self.coordinator.async_activate_trigger(self._trigger_number)
-        except Exception as err:
-            _LOGGER.error("Failed to activate trigger %d: %s", self._trigger_number, err)
-            raise
+        _LOGGER.debug("Activating trigger %d (%s)", self._trigger_number, self._trigger_name)
+        await self.coordinator.async_activate_trigger(self._trigger_number)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Deactivate the trigger."""
-        _LOGGER.info("Deactivating trigger %d (%s)", self._trigger_number, self._trigger_name)
-        try:
-            await self.coordinator.async_deactivate_trigger(self._trigger_number)
-        except Exception as err:
-            _LOGGER.error("Failed to deactivate trigger %d: %s", self._trigger_number, err)
-            raise
+        _LOGGER.debug("Deactivating trigger %d (%s)", self._trigger_number, self._trigger_name)
+        await self.coordinator.async_deactivate_trigger(self._trigger_number)
 
 
 class AritechForceArmSwitch(SwitchEntity, RestoreEntity):
     """Switch to enable/disable force arm mode for an area."""
 
+    __slots__ = ("coordinator", "_area_number", "_area_name", "_is_on")
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:shield-lock"
@@ -468,11 +409,11 @@ class AritechForceArmSwitch(SwitchEntity, RestoreEntity):
         self._is_on = False
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_area_{area_number}_force_arm"
+        self._attr_unique_id = coordinator.get_unique_id("area", area_number) + "_force_arm"
         self._attr_name = "Force Arm"
 
         # Force arm switch belongs to the area device
-        self._attr_device_info = _get_area_device_info(coordinator, area_number, area_name)
+        self._attr_device_info = coordinator.get_device_info("area", area_number, area_name, "Area")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -496,14 +437,14 @@ class AritechForceArmSwitch(SwitchEntity, RestoreEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable force arm mode."""
-        _LOGGER.info("Enabling force arm for area %d (%s)", self._area_number, self._area_name)
+        _LOGGER.debug("Enabling force arm for area %d (%s)", self._area_number, self._area_name)
         self._is_on = True
         self.coordinator.set_force_arm(self._area_number, True)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable force arm mode."""
-        _LOGGER.info("Disabling force arm for area %d (%s)", self._area_number, self._area_name)
+        _LOGGER.debug("Disabling force arm for area %d (%s)", self._area_number, self._area_name)
         self._is_on = False
         self.coordinator.set_force_arm(self._area_number, False)
         self.async_write_ha_state()
@@ -512,6 +453,15 @@ class AritechForceArmSwitch(SwitchEntity, RestoreEntity):
 class AritechDoorEnableSwitch(SwitchEntity):
     """Switch to enable/disable a door."""
 
+    __slots__ = (
+        "coordinator",
+        "_door_number",
+        "_door_name",
+        "_attrs_state",
+        "_attrs",
+        "_last_state",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:door"
@@ -526,37 +476,35 @@ class AritechDoorEnableSwitch(SwitchEntity):
         self.coordinator = coordinator
         self._door_number = door_number
         self._door_name = door_name
-        self._unregister_callback: callable | None = None
+        self._attrs_state: DoorState | None = None
+        self._attrs: dict[str, Any] = {"door_number": door_number}
+        self._last_state: tuple | None = None
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_enable"
+        self._attr_unique_id = coordinator.get_unique_id("door", door_number) + "_enable"
         self._attr_name = "Enabled"
 
         # Door enable switch belongs to the door device
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
+        self._attr_device_info = coordinator.get_device_info("door", door_number, door_name, "Door")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-
+        # Per-number callbacks also fire on (re)connect/disconnect
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_door_callback(
+                self._door_number, self._handle_door_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_door_update(self) -> None:
-        """Handle door state update."""
+        """Handle door state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -575,38 +523,44 @@ class AritechDoorEnableSwitch(SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the state object changes."""
         door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return {"door_number": self._door_number}
+        if door_state is self._attrs_state:
+            return self._attrs
 
-        return {
-            "door_number": self._door_number,
-            "state_text": str(door_state),
-        }
+        self._attrs_state = door_state
+        if not door_state:
+            self._attrs = {"door_number": self._door_number}
+        else:
+            self._attrs = {
+                "door_number": self._door_number,
+                "state_text": str(door_state),
+            }
+        return self._attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the door."""
-        _LOGGER.info("Enabling door %d (%s)", self._door_number, self._door_name)
-        try:
-            await self.coordinator.async_enable_door(self._door_number)
-        except Exception as err:
-            _LOGGER.error("Failed to enable door %d: %s", self._door_number, err)
-            raise
+        _LOGGER.debug("Enabling door %d (%s)", self._door_number, self._door_name)
+        await self.coordinator.async_enable_door(self._door_number)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the door."""
-        _LOGGER.info("Disabling door %d (%s)", self._door_number, self._door_name)
-        try:
-            await self.coordinator.async_disable_door(self._door_number)
-        except Exception as err:
-            _LOGGER.error("Failed to disable door %d: %s", self._door_number, err)
-            raise
+        _LOGGER.debug("Disabling door %d (%s)", self._door_number, self._door_name)
+        await self.coordinator.async_disable_door(self._door_number)
 
 
 class AritechDoorLockSwitch(SwitchEntity):
     """Switch to lock/unlock a door."""
 
+    __slots__ = (
+        "coordinator",
+        "_door_number",
+        "_door_name",
+        "_attrs_state",
+        "_attrs",
+        "_last_state",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:door-closed-lock"
@@ -621,37 +575,37 @@ class AritechDoorLockSwitch(SwitchEntity):
         self.coordinator = coordinator
         self._door_number = door_number
         self._door_name = door_name
-        self._unregister_callback: callable | None = None
+        self._attrs_state: DoorState | None = None
+        self._attrs: dict[str, Any] = {"door_number": door_number}
+        self._last_state: tuple | None = None
 
         # Entity attributes
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_door_{door_number}_lock"
+        self._attr_unique_id = coordinator.get_unique_id("door", door_number) + "_lock"
         self._attr_name = "Unlocked"
+        self._attr_icon = _door_lock_icon(self.is_on)
 
         # Door lock switch belongs to the door device
-        self._attr_device_info = _get_door_device_info(coordinator, door_number, door_name)
+        self._attr_device_info = coordinator.get_device_info("door", door_number, door_name, "Door")
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        self._unregister_callback = self.coordinator.register_door_callback(
-            self._door_number, self._handle_door_update
-        )
-
+        # Per-number callbacks also fire on (re)connect/disconnect
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.register_door_callback(
+                self._door_number, self._handle_door_update
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is being removed."""
-        if self._unregister_callback:
-            self._unregister_callback()
-            self._unregister_callback = None
-        await super().async_will_remove_from_hass()
-
     @callback
     def _handle_door_update(self) -> None:
-        """Handle door state update."""
+        """Handle door state update, skipping the write if nothing we expose changed."""
+        state = (self.available, self.is_on, self.extra_state_attributes)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._attr_icon = _door_lock_icon(state[1])
         self.async_write_ha_state()
 
     @property
@@ -668,40 +622,30 @@ class AritechDoorLockSwitch(SwitchEntity):
         # Switch is ON when door is unlocked
         return not door_state.is_locked
 
-    @property
-    def icon(self) -> str:
-        """Return icon based on lock state."""
-        if self.is_on:
-            return "mdi:door-open"
-        return "mdi:door-closed-lock"
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
+        """Return extra state attributes, rebuilt only when the state object changes."""
         door_state = self.coordinator.get_door_state_obj(self._door_number)
-        if not door_state:
-            return {"door_number": self._door_number}
+        if door_state is self._attrs_state:
+            return self._attrs
 
-        return {
-            "door_number": self._door_number,
-            "state_text": str(door_state),
-            "is_opened": door_state.is_opened,
-        }
+        self._attrs_state = door_state
+        if not door_state:
+            self._attrs = {"door_number": self._door_number}
+        else:
+            self._attrs = {
+                "door_number": self._door_number,
+                "state_text": str(door_state),
+                "is_opened": door_state.is_opened,
+            }
+        return self._attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Unlock the door."""
-        _LOGGER.info("Unlocking door %d (%s)", self._door_number, self._door_name)
-        try:
-            await self.coordinator.async_unlock_door(self._door_number)
-        except Exception as err:
-            _LOGGER.error("Failed to unlock door %d: %s", self._door_number, err)
-            raise
+        _LOGGER.debug("Unlocking door %d (%s)", self._door_number, self._door_name)
+        await self.coordinator.async_unlock_door(self._door_number)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Lock the door."""
-        _LOGGER.info("Locking door %d (%s)", self._door_number, self._door_name)
-        try:
-            await self.coordinator.async_lock_door(self._door_number)
-        except Exception as err:
-            _LOGGER.error("Failed to lock door %d: %s", self._door_number, err)
-            raise
+        _LOGGER.debug("Locking door %d (%s)", self._door_number, self._door_name)
+        await self.coordinator.async_lock_door(self._door_number)
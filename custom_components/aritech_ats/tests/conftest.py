@@ -4,12 +4,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-# Add custom_components directory to path for proper package imports
+# Add custom_components directory to path for proper package imports. pytest
+# loads this conftest before collecting the test modules, so this covers them.
 _custom_components_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_custom_components_dir))
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from dataclasses import dataclass
+from functools import cache, partial
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,6 +21,7 @@ import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 
+from aritech_ats.coordinator import AritechCoordinator
 from aritech_ats.const import (
     CONF_ENCRYPTION_KEY,
     CONF_PIN_CODE,
@@ -63,9 +67,17 @@ MOCK_X700_CONFIG = {
 # Legacy config for backwards compatibility
 MOCK_CONFIG = MOCK_X500_CONFIG
 
+# Read-only views handed out by the config fixtures; a test that needs to
+# modify one should take a copy with dict(...)
+_MOCK_CONNECTION_CONFIG_VIEW = MappingProxyType(MOCK_CONNECTION_CONFIG)
+_MOCK_X500_CONFIG_VIEW = MappingProxyType(MOCK_X500_CONFIG)
+_MOCK_X700_CONFIG_VIEW = MappingProxyType(MOCK_X700_CONFIG)
 
-# Mock state dataclasses to simulate aritech_client library
-@dataclass
+
+# Mock state dataclasses to simulate aritech_client library. Slotted like the
+# real ones, and frozen because the integration replaces state objects rather
+# than mutating them (entities memoize on their identity).
+@dataclass(slots=True, frozen=True)
 class MockAreaState:
     """Mock AreaState from aritech_client."""
 
@@ -107,7 +119,7 @@ class MockAreaState:
         return "Unset"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockZoneState:
     """Mock ZoneState from aritech_client."""
 
@@ -141,7 +153,7 @@ class MockZoneState:
         return ", ".join(states) if states else "Normal"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockOutputState:
     """Mock OutputState from aritech_client."""
 
@@ -156,7 +168,7 @@ class MockOutputState:
         return "Off"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockTriggerState:
     """Mock TriggerState from aritech_client."""
 
@@ -171,7 +183,7 @@ class MockTriggerState:
         return "Active" if self.is_active else "Inactive"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockNamedItem:
     """Mock NamedItem from aritech_client."""
 
@@ -248,8 +260,42 @@ def create_mock_monitor() -> MagicMock:
     return monitor
 
 
+def create_base_mock_coordinator() -> MagicMock:
+    """Create a mock coordinator with the parts every platform entity uses.
+
+    Platform test modules extend it with the state getters and commands they
+    exercise.
+    """
+    coordinator = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.entry_id = "test_entry_id"
+    coordinator.connected = True
+    coordinator.panel_model = "ATS4500"
+    coordinator.panel_name = "Test Panel"
+    coordinator.firmware_version = "1.2.3"
+    coordinator.get_unique_id.side_effect = (
+        lambda kind, number: f"test_entry_id_{kind}_{number}"
+    )
+    # Real device info builders, caching on the mock like on a coordinator
+    coordinator._device_info_cache = {}
+    coordinator.get_device_info = partial(AritechCoordinator.get_device_info, coordinator)
+    coordinator.get_panel_device_info = partial(
+        AritechCoordinator.get_panel_device_info, coordinator
+    )
+    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
+    for kind in ("area", "zone", "output", "trigger", "door"):
+        setattr(
+            coordinator, f"register_{kind}_callback", MagicMock(return_value=lambda: None)
+        )
+    return coordinator
+
+
+@cache
 def create_mock_initialized_event() -> MockInitializedEvent:
-    """Create a mock InitializedEvent with sample data."""
+    """Create a mock InitializedEvent with sample data.
+
+    The event is built once and shared, so treat it as read-only.
+    """
     return MockInitializedEvent(
         zones=[
             MockNamedItem(1, "Front Door"),
@@ -287,27 +333,27 @@ def create_mock_initialized_event() -> MockInitializedEvent:
 
 
 @pytest.fixture
-def mock_config() -> dict[str, Any]:
+def mock_config() -> Mapping[str, Any]:
     """Return mock configuration (x500 for backwards compatibility)."""
-    return MOCK_CONFIG.copy()
+    return _MOCK_X500_CONFIG_VIEW
 
 
 @pytest.fixture
-def mock_connection_config() -> dict[str, Any]:
+def mock_connection_config() -> Mapping[str, Any]:
     """Return mock connection-only configuration (step 1)."""
-    return MOCK_CONNECTION_CONFIG.copy()
+    return _MOCK_CONNECTION_CONFIG_VIEW
 
 
 @pytest.fixture
-def mock_x500_config() -> dict[str, Any]:
+def mock_x500_config() -> Mapping[str, Any]:
     """Return mock x500 full configuration."""
-    return MOCK_X500_CONFIG.copy()
+    return _MOCK_X500_CONFIG_VIEW
 
 
 @pytest.fixture
-def mock_x700_config() -> dict[str, Any]:
+def mock_x700_config() -> Mapping[str, Any]:
     """Return mock x700 full configuration."""
-    return MOCK_X700_CONFIG.copy()
+    return _MOCK_X700_CONFIG_VIEW
 
 
 @pytest.fixture
@@ -328,7 +374,7 @@ def mock_monitor() -> MagicMock:
     return create_mock_monitor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_initialized_event() -> MockInitializedEvent:
     """Return a mock InitializedEvent."""
     return create_mock_initialized_event()
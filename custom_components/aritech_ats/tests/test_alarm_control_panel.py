@@ -1,13 +1,6 @@
 """Tests for Aritech alarm control panel."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,6 +16,7 @@ from aritech_ats.alarm_control_panel import (
 from .conftest import (
     MOCK_CONFIG,
     MockAreaState,
+    create_base_mock_coordinator,
     create_mock_client,
     create_mock_monitor,
 )
@@ -30,12 +24,7 @@ from .conftest import (
 
 def create_mock_coordinator() -> MagicMock:
     """Create a mock coordinator for testing."""
-    coordinator = MagicMock()
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_entry_id"
-    coordinator.connected = True
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    coordinator.register_area_callback = MagicMock(return_value=lambda: None)
+    coordinator = create_base_mock_coordinator()
     coordinator.get_area_state_obj = MagicMock(return_value=MockAreaState())
     coordinator.get_force_arm = MagicMock(return_value=False)
     coordinator.async_arm_area = AsyncMock()
@@ -90,6 +79,11 @@ class TestGetAlarmState:
         state = MockAreaState(is_alarming=True, is_full_set=True)
         assert _get_alarm_state(state) == AlarmControlPanelState.TRIGGERED
 
+    def test_full_set_takes_priority_over_part_set(self) -> None:
+        """Test that full set wins when several armed flags are set."""
+        state = MockAreaState(is_unset=False, is_full_set=True, is_partially_set=True)
+        assert _get_alarm_state(state) == AlarmControlPanelState.ARMED_AWAY
+
 
 class TestAritechAlarmControlPanel:
     """Tests for AritechAlarmControlPanel entity."""
@@ -135,6 +129,28 @@ class TestAritechAlarmControlPanel:
 
         assert panel.available is False
 
+    def test_update_skips_unchanged_state(self) -> None:
+        """Test area updates only write state when the area changed."""
+        coordinator = create_mock_coordinator()
+        coordinator.get_area_state_obj.return_value = MockAreaState(is_unset=True)
+
+        panel = AritechAlarmControlPanel(
+            coordinator=coordinator,
+            area_number=1,
+            area_name="Test Area",
+        )
+        panel.async_write_ha_state = MagicMock()
+
+        panel._handle_area_update()
+        panel._handle_area_update()
+        assert panel.async_write_ha_state.call_count == 1
+
+        coordinator.get_area_state_obj.return_value = MockAreaState(
+            is_unset=False, is_full_set=True
+        )
+        panel._handle_area_update()
+        assert panel.async_write_ha_state.call_count == 2
+
     def test_alarm_state_disarmed(self) -> None:
         """Test alarm state returns disarmed when area is unset."""
         coordinator = create_mock_coordinator()
@@ -185,6 +201,24 @@ class TestAritechAlarmControlPanel:
         assert attrs["is_tampered"] is False
         assert attrs["has_fire"] is False
 
+    def test_extra_state_attributes_cached_until_state_changes(self) -> None:
+        """Test attributes are reused until a new AreaState is published."""
+        coordinator = create_mock_coordinator()
+        coordinator.get_area_state_obj.return_value = MockAreaState(is_ready_to_arm=True)
+
+        panel = AritechAlarmControlPanel(
+            coordinator=coordinator,
+            area_number=1,
+            area_name="Test Area",
+        )
+
+        attrs = panel.extra_state_attributes
+        assert panel.extra_state_attributes is attrs
+
+        coordinator.get_area_state_obj.return_value = MockAreaState(is_ready_to_arm=False)
+        assert panel.extra_state_attributes is not attrs
+        assert panel.extra_state_attributes["is_ready_to_arm"] is False
+
     def test_extra_state_attributes_no_state(self) -> None:
         """Test extra state attributes when no state available."""
         coordinator = create_mock_coordinator()
@@ -1,13 +1,6 @@
 """Tests for Aritech binary sensors."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
 from unittest.mock import MagicMock
 
 import pytest
@@ -28,18 +21,12 @@ from aritech_ats.binary_sensor import (
     guess_device_class,
 )
 
-from .conftest import MockAreaState, MockZoneState
+from .conftest import MockAreaState, MockZoneState, create_base_mock_coordinator
 
 
 def create_mock_coordinator() -> MagicMock:
     """Create a mock coordinator for testing."""
-    coordinator = MagicMock()
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_entry_id"
-    coordinator.connected = True
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    coordinator.register_zone_callback = MagicMock(return_value=lambda: None)
-    coordinator.register_area_callback = MagicMock(return_value=lambda: None)
+    coordinator = create_base_mock_coordinator()
     coordinator.get_zone_state_obj = MagicMock(return_value=MockZoneState())
     coordinator.get_area_state_obj = MagicMock(return_value=MockAreaState())
     return coordinator
@@ -48,66 +35,40 @@ def create_mock_coordinator() -> MagicMock:
 class TestGuessDeviceClass:
     """Tests for guess_device_class function."""
 
-    def test_pir_returns_motion(self) -> None:
-        """Test PIR in name returns motion class."""
-        assert guess_device_class("Living Room PIR") == BinarySensorDeviceClass.MOTION
-
-    def test_motion_returns_motion(self) -> None:
-        """Test motion in name returns motion class."""
-        assert guess_device_class("Motion Sensor") == BinarySensorDeviceClass.MOTION
-
-    def test_door_returns_door(self) -> None:
-        """Test door in name returns door class."""
-        assert guess_device_class("Front Door") == BinarySensorDeviceClass.DOOR
-
-    def test_window_returns_window(self) -> None:
-        """Test window in name returns window class."""
-        assert guess_device_class("Kitchen Window") == BinarySensorDeviceClass.WINDOW
-
-    def test_smoke_returns_smoke(self) -> None:
-        """Test smoke in name returns smoke class."""
-        # Note: "Smoke Detector" would match "detector" -> MOTION first
-        assert guess_device_class("Smoke Alarm") == BinarySensorDeviceClass.SMOKE
-
-    def test_glass_returns_vibration(self) -> None:
-        """Test glass break in name returns vibration class."""
-        assert guess_device_class("Glass Break") == BinarySensorDeviceClass.VIBRATION
-
-    def test_garage_returns_garage_door(self) -> None:
-        """Test garage in name returns garage door class."""
-        # Note: "Garage Door" matches "door" -> DOOR first, use just "Garage"
-        assert guess_device_class("Garage") == BinarySensorDeviceClass.GARAGE_DOOR
-
-    def test_tamper_returns_tamper(self) -> None:
-        """Test tamper in name returns tamper class."""
-        assert guess_device_class("Tamper Zone") == BinarySensorDeviceClass.TAMPER
-
-    def test_panic_returns_safety(self) -> None:
-        """Test panic in name returns safety class."""
-        assert guess_device_class("Panic Button") == BinarySensorDeviceClass.SAFETY
-
-    def test_water_returns_moisture(self) -> None:
-        """Test water in name returns moisture class."""
-        assert guess_device_class("Water Leak") == BinarySensorDeviceClass.MOISTURE
-
-    def test_heat_returns_heat(self) -> None:
-        """Test heat in name returns heat class."""
-        # Note: "Heat Detector" would match "detector" -> MOTION first
-        assert guess_device_class("Heat Sensor") == BinarySensorDeviceClass.HEAT
-
-    def test_gas_returns_gas(self) -> None:
-        """Test gas in name returns gas class."""
-        # Note: "Gas Detector" would match "detector" -> MOTION first
-        assert guess_device_class("Gas Sensor") == BinarySensorDeviceClass.GAS
-
-    def test_unknown_defaults_to_motion(self) -> None:
-        """Test unknown name defaults to motion class."""
-        assert guess_device_class("Zone 1") == BinarySensorDeviceClass.MOTION
-
-    def test_case_insensitive(self) -> None:
-        """Test matching is case insensitive."""
-        assert guess_device_class("FRONT DOOR") == BinarySensorDeviceClass.DOOR
-        assert guess_device_class("front door") == BinarySensorDeviceClass.DOOR
+    @pytest.mark.parametrize(
+        ("zone_name", "expected"),
+        [
+            ("Living Room PIR", BinarySensorDeviceClass.MOTION),
+            ("Motion Sensor", BinarySensorDeviceClass.MOTION),
+            ("Front Door", BinarySensorDeviceClass.DOOR),
+            ("Kitchen Window", BinarySensorDeviceClass.WINDOW),
+            # "Smoke Detector" would match "detector" -> MOTION first
+            ("Smoke Alarm", BinarySensorDeviceClass.SMOKE),
+            ("Glass Break", BinarySensorDeviceClass.VIBRATION),
+            # "Garage Door" matches "door" -> DOOR first, use just "Garage"
+            ("Garage", BinarySensorDeviceClass.GARAGE_DOOR),
+            ("Tamper Zone", BinarySensorDeviceClass.TAMPER),
+            ("Panic Button", BinarySensorDeviceClass.SAFETY),
+            ("Water Leak", BinarySensorDeviceClass.MOISTURE),
+            # "Heat Detector" would match "detector" -> MOTION first
+            ("Heat Sensor", BinarySensorDeviceClass.HEAT),
+            # "Gas Detector" would match "detector" -> MOTION first
+            ("Gas Sensor", BinarySensorDeviceClass.GAS),
+            # Unknown names default to motion
+            ("Zone 1", BinarySensorDeviceClass.MOTION),
+            # Matching is case insensitive
+            ("FRONT DOOR", BinarySensorDeviceClass.DOOR),
+            ("front door", BinarySensorDeviceClass.DOOR),
+            # Earlier patterns win even when a later one matches first in the name
+            ("Garage Door", BinarySensorDeviceClass.DOOR),
+            ("Smoke Detector", BinarySensorDeviceClass.MOTION),
+        ],
+    )
+    def test_guess_device_class(
+        self, zone_name: str, expected: BinarySensorDeviceClass
+    ) -> None:
+        """Test the device class guessed from a zone name."""
+        assert guess_device_class(zone_name) == expected
 
 
 class TestZoneActiveBinarySensor:
@@ -193,6 +154,49 @@ class TestZoneActiveBinarySensor:
         assert attrs["is_anti_mask"] is False
 
 
+    def test_update_skips_unchanged_state(self) -> None:
+        """Test zone updates only write state when the exposed state changes."""
+        coordinator = create_mock_coordinator()
+        coordinator.get_zone_state_obj.return_value = MockZoneState(is_active=False)
+
+        sensor = AritechZoneActiveBinarySensor(
+            coordinator=coordinator,
+            zone_number=1,
+            zone_name="Front Door",
+        )
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_zone_update()
+        sensor._handle_zone_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        coordinator.get_zone_state_obj.return_value = MockZoneState(is_active=True)
+        sensor._handle_zone_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+
+class TestZoneDeviceInfo:
+    """Tests for zone device info sharing."""
+
+    def test_sibling_sensors_share_device_info(self) -> None:
+        """Test all sensors of one zone reuse a single DeviceInfo."""
+        coordinator = create_mock_coordinator()
+
+        active = AritechZoneActiveBinarySensor(
+            coordinator=coordinator,
+            zone_number=1,
+            zone_name="Front Door",
+        )
+        tamper = AritechZoneTamperBinarySensor(
+            coordinator=coordinator,
+            zone_number=1,
+            zone_name="Front Door",
+        )
+
+        assert active._attr_device_info is tamper._attr_device_info
+        assert active._attr_device_info["name"] == "Front Door"
+
+
 class TestZoneTamperBinarySensor:
     """Tests for AritechZoneTamperBinarySensor."""
 
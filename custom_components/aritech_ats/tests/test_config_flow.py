@@ -1,13 +1,6 @@
 """Tests for Aritech config flow."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,6 +12,8 @@ from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME, CONF_PASSWO
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
+from aritech_client import AritechError, ErrorCode
+
 from aritech_ats.const import (
     CONF_ENCRYPTION_KEY,
     CONF_PIN_CODE,
@@ -107,6 +102,15 @@ class TestValidateConnection:
         with pytest.raises(vol.Invalid, match="Encryption key must contain only digits"):
             await validate_connection(hass, invalid_config)
 
+    @pytest.mark.asyncio
+    async def test_invalid_encryption_key_non_ascii_digits(self, hass: HomeAssistant) -> None:
+        """Test validate_connection rejects non-ASCII digits in the encryption key."""
+        invalid_config = MOCK_CONNECTION_CONFIG.copy()
+        invalid_config[CONF_ENCRYPTION_KEY] = "\u0661" * 24
+
+        with pytest.raises(vol.Invalid, match="Encryption key must contain only digits"):
+            await validate_connection(hass, invalid_config)
+
     @pytest.mark.asyncio
     async def test_invalid_encryption_key_wrong_length(self, hass: HomeAssistant) -> None:
         """Test validate_connection with wrong length encryption key."""
@@ -155,7 +159,9 @@ class TestValidateFullConnection:
     async def test_auth_error_raises_invalid_auth(self, hass: HomeAssistant) -> None:
         """Test validate_full_connection raises InvalidAuth on authentication failure."""
         mock_client = create_mock_client()
-        mock_client.initialize.side_effect = Exception("Login failed: invalid credentials")
+        mock_client.initialize.side_effect = AritechError(
+            "Login failed - status code 0x01", code=ErrorCode.LOGIN_FAILED
+        )
 
         with patch(
             "aritech_ats.config_flow.AritechClient",
@@ -164,6 +170,22 @@ class TestValidateFullConnection:
             with pytest.raises(InvalidAuth):
                 await validate_full_connection(hass, MOCK_X500_CONFIG)
 
+    @pytest.mark.asyncio
+    async def test_other_error_raises_cannot_connect(self, hass: HomeAssistant) -> None:
+        """Test errors other than a failed login are not reported as bad credentials."""
+        mock_client = create_mock_client()
+        mock_client.initialize.side_effect = AritechError(
+            "Failed to decrypt createSession response",
+            code=ErrorCode.KEY_EXCHANGE_FAILED,
+        )
+
+        with patch(
+            "aritech_ats.config_flow.AritechClient",
+            return_value=mock_client,
+        ):
+            with pytest.raises(CannotConnect):
+                await validate_full_connection(hass, MOCK_X500_CONFIG)
+
     @pytest.mark.asyncio
     async def test_panel_without_name(self, hass: HomeAssistant) -> None:
         """Test validate_full_connection when panel doesn't report a name."""
@@ -311,7 +333,9 @@ class TestConfigFlowIntegration:
             assert result["step_id"] == "x500_auth"
 
             # Step 2: Auth fails
-            mock_client.initialize.side_effect = Exception("Login failed")
+            mock_client.initialize.side_effect = AritechError(
+                "Login failed", code=ErrorCode.LOGIN_FAILED
+            )
             result = await hass.config_entries.flow.async_configure(
                 result["flow_id"],
                 {CONF_PIN_CODE: "wrong"},
@@ -1,13 +1,7 @@
 """Tests for Aritech coordinator."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -16,11 +10,13 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from aritech_ats.coordinator import AritechCoordinator, AritechData
+from aritech_ats.coordinator import AritechCoordinator, AritechData, _index_names
 
 from .conftest import (
     MOCK_CONFIG,
     MockAreaState,
+    MockChangeEvent,
+    MockNamedItem,
     MockZoneState,
     MockOutputState,
     MockTriggerState,
@@ -67,6 +63,33 @@ async def test_coordinator_connect_success(hass: HomeAssistant) -> None:
         mock_monitor.start.assert_called_once()
 
 
+async def test_coordinator_connect_notifies_callbacks(hass: HomeAssistant) -> None:
+    """Test entities are refreshed once the connection is marked up."""
+    mock_client = create_mock_client()
+    mock_monitor = create_mock_monitor()
+    entry = create_mock_config_entry(hass)
+
+    with (
+        patch(
+            "aritech_ats.coordinator.AritechClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "aritech_ats.coordinator.AritechMonitor",
+            return_value=mock_monitor,
+        ),
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        availability: list[bool] = []
+        coordinator.register_area_callback(
+            1, lambda: availability.append(coordinator.connected)
+        )
+
+        await coordinator.async_connect()
+
+        assert availability == [True]
+
+
 async def test_coordinator_connect_failure(hass: HomeAssistant) -> None:
     """Test coordinator connection failure."""
     mock_client = create_mock_client()
@@ -110,6 +133,180 @@ async def test_coordinator_disconnect(hass: HomeAssistant) -> None:
         mock_monitor.stop.assert_called_once()
 
 
+async def test_coordinator_disconnect_notifies_callbacks(hass: HomeAssistant) -> None:
+    """Test losing the connection refreshes entities so they become unavailable."""
+    mock_client = create_mock_client()
+    mock_monitor = create_mock_monitor()
+    entry = create_mock_config_entry(hass)
+
+    with (
+        patch(
+            "aritech_ats.coordinator.AritechClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "aritech_ats.coordinator.AritechMonitor",
+            return_value=mock_monitor,
+        ),
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        await coordinator.async_connect()
+
+        area_callback = MagicMock()
+        coordinator.register_area_callback(1, area_callback)
+
+        await coordinator.async_disconnect()
+        area_callback.assert_called_once()
+
+        # Disconnecting again is a no-op for entities
+        await coordinator.async_disconnect()
+        area_callback.assert_called_once()
+
+
+async def test_coordinator_reconnect_hung_disconnect(hass: HomeAssistant) -> None:
+    """Test a hung teardown does not block the reconnect."""
+    mock_client = create_mock_client()
+    mock_monitor = create_mock_monitor()
+    entry = create_mock_config_entry(hass)
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    with (
+        patch(
+            "aritech_ats.coordinator.AritechClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "aritech_ats.coordinator.AritechMonitor",
+            return_value=mock_monitor,
+        ),
+        patch("aritech_ats.coordinator.DISCONNECT_TIMEOUT", 0.01),
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        await coordinator.async_connect()
+        mock_client.disconnect.side_effect = hang
+        coordinator._get_reconnect_delay = MagicMock(return_value=0)
+
+        coordinator._schedule_reconnect()
+        await coordinator._reconnect_task
+
+        assert coordinator.connected is True
+        assert mock_client.connect.call_count == 2
+
+
+async def test_coordinator_reconnect_hung_disconnect_marks_unavailable(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities see the outage when teardown hangs and the reconnect fails."""
+    mock_client = create_mock_client()
+    mock_monitor = create_mock_monitor()
+    entry = create_mock_config_entry(hass)
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    with (
+        patch(
+            "aritech_ats.coordinator.AritechClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "aritech_ats.coordinator.AritechMonitor",
+            return_value=mock_monitor,
+        ),
+        patch("aritech_ats.coordinator.DISCONNECT_TIMEOUT", 0.01),
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        await coordinator.async_connect()
+        mock_client.disconnect.side_effect = hang
+
+        def fail_connect() -> None:
+            # Only the old socket hangs; the failed attempt's cleanup returns
+            mock_client.disconnect.side_effect = None
+            raise Exception("Connection failed")
+
+        mock_client.connect.side_effect = fail_connect
+        coordinator._get_reconnect_delay = MagicMock(side_effect=[0, 3600])
+
+        seen: list[bool] = []
+        coordinator.register_area_callback(1, lambda: seen.append(coordinator.connected))
+
+        coordinator._schedule_reconnect()
+        await coordinator._reconnect_task
+
+        assert seen == [False]
+        assert coordinator.connected is False
+
+        await coordinator.async_disconnect()
+
+
+async def test_coordinator_reconnect_failure_reschedules(hass: HomeAssistant) -> None:
+    """Test a failed reconnect schedules the next attempt."""
+    mock_client = create_mock_client()
+    mock_client.connect.side_effect = Exception("Connection failed")
+    entry = create_mock_config_entry(hass)
+
+    with patch(
+        "aritech_ats.coordinator.AritechClient",
+        return_value=mock_client,
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        coordinator._get_reconnect_delay = MagicMock(side_effect=[0, 3600])
+
+        coordinator._schedule_reconnect()
+        first_task = coordinator._reconnect_task
+        await first_task
+
+        assert coordinator._reconnect_attempt == 2
+        assert coordinator._reconnect_task is not None
+        assert coordinator._reconnect_task is not first_task
+
+        # Disconnecting stops the retry chain
+        second_task = coordinator._reconnect_task
+        await coordinator.async_disconnect()
+        await asyncio.sleep(0)
+
+        assert second_task.cancelled()
+        assert coordinator._reconnect_task is None
+        assert coordinator._reconnect_attempt == 0
+
+
+async def test_coordinator_zone_change_skips_equal_state(hass: HomeAssistant) -> None:
+    """Test a change event with an identical decoded state notifies nobody."""
+    mock_client = create_mock_client()
+    mock_monitor = create_mock_monitor()
+    entry = create_mock_config_entry(hass)
+
+    with (
+        patch(
+            "aritech_ats.coordinator.AritechClient",
+            return_value=mock_client,
+        ),
+        patch(
+            "aritech_ats.coordinator.AritechMonitor",
+            return_value=mock_monitor,
+        ),
+    ):
+        coordinator = AritechCoordinator(hass, entry)
+        await coordinator.async_connect()
+        handle_zone_changed = mock_monitor.on_zone_changed.call_args[0][0]
+
+        zone_callback = MagicMock()
+        coordinator.register_zone_callback(1, zone_callback)
+
+        handle_zone_changed(
+            MockChangeEvent(1, "Front Door", None, {"state": MockZoneState(is_active=True)})
+        )
+        zone_callback.assert_called_once()
+
+        handle_zone_changed(
+            MockChangeEvent(1, "Front Door", None, {"state": MockZoneState(is_active=True)})
+        )
+        zone_callback.assert_called_once()
+        assert coordinator.get_zone_state_obj(1).is_active is True
+
+
 async def test_coordinator_get_areas(hass: HomeAssistant) -> None:
     """Test getting areas from coordinator."""
     mock_client = create_mock_client()
@@ -131,15 +328,12 @@ async def test_coordinator_get_areas(hass: HomeAssistant) -> None:
 
         # Simulate initialized event
         event = create_mock_initialized_event()
-        coordinator._data.areas = [
-            {"number": a.number, "name": a.name} for a in event.areas
-        ]
-        coordinator._data.area_states = event.area_states
+        coordinator._data.areas = {a.number: a.name for a in event.areas}
+        coordinator._data.area_states = {n: d["state"] for n, d in event.area_states.items()}
 
-        areas = coordinator.get_areas()
+        areas = list(coordinator.get_areas())
         assert len(areas) == 2
-        assert areas[0]["number"] == 1
-        assert areas[0]["name"] == "Ground Floor"
+        assert areas[0] == (1, "Ground Floor")
 
 
 async def test_coordinator_get_zones(hass: HomeAssistant) -> None:
@@ -163,13 +357,38 @@ async def test_coordinator_get_zones(hass: HomeAssistant) -> None:
 
         # Simulate initialized event
         event = create_mock_initialized_event()
-        coordinator._data.zones = [
-            {"number": z.number, "name": z.name} for z in event.zones
-        ]
+        coordinator._data.zones = {z.number: z.name for z in event.zones}
 
-        zones = coordinator.get_zones()
+        zones = list(coordinator.get_zones())
         assert len(zones) == 3
-        assert zones[0]["name"] == "Front Door"
+        assert zones[0][1] == "Front Door"
+
+
+async def test_coordinator_get_names(hass: HomeAssistant) -> None:
+    """Test looking up entity names by number."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    event = create_mock_initialized_event()
+    coordinator._data.zones = {z.number: z.name for z in event.zones}
+    coordinator._data.areas = {a.number: a.name for a in event.areas}
+
+    assert coordinator.get_zone_name(1) == "Front Door"
+    assert coordinator.get_area_name(2) == "First Floor"
+    assert coordinator.get_zone_name(999) is None
+    assert coordinator.get_door_name(1) is None
+
+
+def test_index_names_reuses_unchanged_map() -> None:
+    """Test the name map is kept across reconnects when entities are unchanged."""
+    event = create_mock_initialized_event()
+    zones = _index_names({}, event.zones)
+    assert zones == {1: "Front Door", 2: "Living Room PIR", 3: "Kitchen Window"}
+
+    assert _index_names(zones, event.zones) is zones
+    renamed = _index_names(zones, [*event.zones[:2], MockNamedItem(3, "Lounge")])
+    assert renamed is not zones
+    assert renamed[3] == "Lounge"
 
 
 async def test_coordinator_get_area_state(hass: HomeAssistant) -> None:
@@ -193,7 +412,7 @@ async def test_coordinator_get_area_state(hass: HomeAssistant) -> None:
 
         # Set up area state
         area_state = MockAreaState(is_unset=True)
-        coordinator._data.area_states[1] = {"state": area_state}
+        coordinator._data.area_states[1] = area_state
 
         state_obj = coordinator.get_area_state_obj(1)
         assert state_obj is not None
@@ -222,7 +441,7 @@ async def test_coordinator_get_zone_state(hass: HomeAssistant) -> None:
 
         # Set up zone state
         zone_state = MockZoneState(is_active=True)
-        coordinator._data.zone_states[1] = {"state": zone_state}
+        coordinator._data.zone_states[1] = zone_state
 
         state_obj = coordinator.get_zone_state_obj(1)
         assert state_obj is not None
@@ -426,9 +645,94 @@ async def test_coordinator_register_callbacks(hass: HomeAssistant) -> None:
         assert 1 in coordinator._area_callbacks
         assert test_callback in coordinator._area_callbacks[1]
 
-        # Unregister callback
+        # Unregistering the last callback drops the area from the registry
         unregister()
-        assert test_callback not in coordinator._area_callbacks[1]
+        assert 1 not in coordinator._area_callbacks
+
+
+async def test_coordinator_unregister_keeps_other_callbacks(hass: HomeAssistant) -> None:
+    """Test unregistering one callback leaves other callbacks for the number."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    first_callback = MagicMock()
+    second_callback = MagicMock()
+    unregister_first = coordinator.register_zone_callback(1, first_callback)
+    coordinator.register_zone_callback(1, second_callback)
+
+    unregister_first()
+    coordinator._notify_callbacks(coordinator._zone_callbacks, 1)
+
+    first_callback.assert_not_called()
+    second_callback.assert_called_once()
+
+
+async def test_coordinator_notify_all_callbacks(hass: HomeAssistant) -> None:
+    """Test a full refresh notifies callbacks of every entity kind."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    area_callback = MagicMock()
+    zone_callback = MagicMock()
+    door_callback = MagicMock()
+    coordinator.register_area_callback(1, area_callback)
+    coordinator.register_zone_callback(2, zone_callback)
+    coordinator.register_door_callback(3, door_callback)
+
+    coordinator._notify_all_callbacks()
+
+    area_callback.assert_called_once()
+    zone_callback.assert_called_once()
+    door_callback.assert_called_once()
+
+
+async def test_coordinator_unregister_twice(hass: HomeAssistant) -> None:
+    """Test a second unregister call is a no-op."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    unregister = coordinator.register_zone_callback(1, MagicMock())
+    unregister()
+    unregister()
+
+    assert 1 not in coordinator._zone_callbacks
+
+
+async def test_coordinator_notify_all_tolerates_unregister(hass: HomeAssistant) -> None:
+    """Test a callback may unregister itself during a full refresh."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    other_callback = MagicMock()
+    unregister = coordinator.register_zone_callback(1, lambda: unregister())
+    coordinator.register_zone_callback(2, other_callback)
+
+    coordinator._notify_all_callbacks()
+
+    assert 1 not in coordinator._zone_callbacks
+    other_callback.assert_called_once()
+
+
+async def test_coordinator_reconnect_delay_jitter(hass: HomeAssistant) -> None:
+    """Test reconnect delays are jittered within the backoff step."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    for attempt, base in ((0, 5), (3, 40), (100, 120)):
+        coordinator._reconnect_attempt = attempt
+        delay = coordinator._get_reconnect_delay()
+        assert base / 2 <= delay <= base
+
+
+async def test_coordinator_get_unique_id(hass: HomeAssistant) -> None:
+    """Test unique ids are built once and shared per (kind, number)."""
+    entry = create_mock_config_entry(hass)
+    coordinator = AritechCoordinator(hass, entry)
+
+    unique_id = coordinator.get_unique_id("area", 1)
+    assert unique_id == "test_entry_id_area_1"
+    assert coordinator.get_unique_id("area", 1) is unique_id
+    assert coordinator.get_unique_id("door", 1) == "test_entry_id_door_1"
 
 
 async def test_coordinator_command_not_connected(hass: HomeAssistant) -> None:
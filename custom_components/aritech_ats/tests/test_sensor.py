@@ -1,13 +1,6 @@
 """Tests for Aritech sensors."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
 from unittest.mock import MagicMock
 
 import pytest
@@ -24,21 +17,12 @@ from aritech_ats.sensor import (
     AritechZoneStateSensor,
 )
 
-from .conftest import MockAreaState, MockZoneState
+from .conftest import MockAreaState, MockZoneState, create_base_mock_coordinator
 
 
 def create_mock_coordinator() -> MagicMock:
     """Create a mock coordinator for testing."""
-    coordinator = MagicMock()
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_entry_id"
-    coordinator.connected = True
-    coordinator.panel_model = "ATS4500"
-    coordinator.panel_name = "Test Panel"
-    coordinator.firmware_version = "1.2.3"
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    coordinator.register_area_callback = MagicMock(return_value=lambda: None)
-    coordinator.register_zone_callback = MagicMock(return_value=lambda: None)
+    coordinator = create_base_mock_coordinator()
     coordinator.get_area_state_obj = MagicMock(return_value=MockAreaState())
     coordinator.get_zone_state_obj = MagicMock(return_value=MockZoneState())
     return coordinator
@@ -1,13 +1,6 @@
 """Tests for Aritech switches."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add custom_components directory to path for proper package imports
-_custom_components_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(_custom_components_dir))
-
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -22,22 +15,17 @@ from aritech_ats.switch import (
     AritechForceArmSwitch,
 )
 
-from .conftest import MockZoneState, MockOutputState, MockTriggerState
+from .conftest import (
+    MockZoneState,
+    MockOutputState,
+    MockTriggerState,
+    create_base_mock_coordinator,
+)
 
 
 def create_mock_coordinator() -> MagicMock:
     """Create a mock coordinator for testing."""
-    coordinator = MagicMock()
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_entry_id"
-    coordinator.connected = True
-    coordinator.panel_model = "ATS4500"
-    coordinator.panel_name = "Test Panel"
-    coordinator.firmware_version = "1.2.3"
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    coordinator.register_zone_callback = MagicMock(return_value=lambda: None)
-    coordinator.register_output_callback = MagicMock(return_value=lambda: None)
-    coordinator.register_trigger_callback = MagicMock(return_value=lambda: None)
+    coordinator = create_base_mock_coordinator()
     coordinator.get_zone_state_obj = MagicMock(return_value=MockZoneState())
     coordinator.get_output_state_obj = MagicMock(return_value=MockOutputState())
     coordinator.get_trigger_state_obj = MagicMock(return_value=MockTriggerState())
@@ -167,6 +155,45 @@ class TestZoneInhibitSwitch:
         assert attrs["zone_number"] == 1
         assert "state_text" in attrs
 
+    def test_extra_state_attributes_cached_per_state(self) -> None:
+        """Test attributes are only rebuilt when the state object changes."""
+        coordinator = create_mock_coordinator()
+        coordinator.get_zone_state_obj.return_value = MockZoneState()
+
+        switch = AritechZoneInhibitSwitch(
+            coordinator=coordinator,
+            zone_number=1,
+            zone_name="Front Door",
+        )
+
+        attrs = switch.extra_state_attributes
+        assert switch.extra_state_attributes is attrs
+
+        coordinator.get_zone_state_obj.return_value = MockZoneState(is_inhibited=True)
+        assert switch.extra_state_attributes is not attrs
+
+    def test_update_skips_unchanged_state(self) -> None:
+        """Test zone updates only write state when the exposed state changes."""
+        coordinator = create_mock_coordinator()
+        coordinator.get_zone_state_obj.return_value = MockZoneState()
+
+        switch = AritechZoneInhibitSwitch(
+            coordinator=coordinator,
+            zone_number=1,
+            zone_name="Front Door",
+        )
+        switch.async_write_ha_state = MagicMock()
+
+        switch._handle_zone_update()
+        # An equal state object (e.g. reloaded after reconnect) is not a change
+        coordinator.get_zone_state_obj.return_value = MockZoneState()
+        switch._handle_zone_update()
+        assert switch.async_write_ha_state.call_count == 1
+
+        coordinator.get_zone_state_obj.return_value = MockZoneState(is_inhibited=True)
+        switch._handle_zone_update()
+        assert switch.async_write_ha_state.call_count == 2
+
 
 class TestOutputSwitch:
     """Tests for AritechOutputSwitch."""